@@ -2,116 +2,169 @@
 Backup manager - orchestrates backup operations
 """
 
+import os
 import tempfile
+import time
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import Optional, Tuple
 
 from ..database.base import DatabaseHandler
-from ..storage.local import LocalStorage
-from ..storage.aws_s3 import AWSS3Storage
-from ..utils.compression import compress_file
+from ..storage.base import StorageHandler
+from ..utils.compression import (
+    codec_suffix,
+    compress_file,
+    compress_file_parallel,
+    open_compressor,
+    preferred_codec,
+)
+from ..utils.hashing import HashingWriter
 from ..utils.logging import get_logger, BackupLogger, log_backup_metrics
+from ..utils.proc import preallocate
 
 logger = get_logger(__name__)
 
 
 class BackupManager:
     """Manages backup operations across databases and storage backends."""
-    
-    def __init__(self, database_handler: DatabaseHandler, storage_handler: Union[LocalStorage, AWSS3Storage]):
+
+    __slots__ = ('db_handler', 'storage_handler', 'backup_logger',
+                 'estimated_compression_ratio', '_size_cache')
+
+    #: How long a database size estimate stays fresh, in seconds.
+    SIZE_CACHE_TTL = 60.0
+
+    def __init__(self, database_handler: DatabaseHandler, storage_handler: StorageHandler,
+                 estimated_compression_ratio: Optional[float] = None):
         """Initialize backup manager.
-        
+
         Args:
             database_handler: Database handler instance
             storage_handler: Storage handler instance
+            estimated_compression_ratio: Expected compressed/raw size ratio
+                (0-1) used by estimate_backup_size; defaults to 0.2
         """
         self.db_handler = database_handler
         self.storage_handler = storage_handler
         self.backup_logger = BackupLogger(__name__)
+        self.estimated_compression_ratio = estimated_compression_ratio
+        self._size_cache = None
     
-    def create_backup(self, compress: bool = True, custom_name: str = None) -> str:
+    def create_backup(self, compress: bool = True, custom_name: str = None,
+                      codec: str = 'gzip', level: int = 3) -> str:
         """Create a complete backup operation.
-        
+
         Args:
             compress: Whether to compress the backup file
             custom_name: Custom name for the backup file (optional)
-            
+            codec: Compression codec ('gzip' or 'zstd'); falls back to
+                gzip when the zstd library is unavailable
+            level: Compression level for the chosen codec
+
         Returns:
             Final backup file identifier/path
-            
+
         Raises:
             Exception: If backup operation fails
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter_ns()
+        codec = preferred_codec(codec)
+        suffix = codec_suffix(codec)
         
+        db_type = self.db_handler.database_type
+
         if custom_name:
             backup_name = custom_name
         else:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            db_type = self.db_handler.get_database_type()
             db_name = self.db_handler.database
             backup_name = f"{db_name}_{db_type}_backup_{timestamp}"
-        
+
         self.backup_logger.start_operation(
-            "backup", 
-            f"{self.db_handler.get_database_type()}://{self.db_handler.host}/{self.db_handler.database}"
+            "backup",
+            f"{db_type}://{self.db_handler.host}/{self.db_handler.database}"
         )
         
         temp_file = None
         compressed_file = None
-        
+        backup_sha256 = None
+
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.dump') as temp:
-                temp_file = temp.name
-            
-            self.backup_logger.log_progress("Creating database dump")
-            
-            if not self.db_handler.create_backup(temp_file):
-                raise Exception("Database backup creation failed")
-            
-            temp_path = Path(temp_file)
-            if not temp_path.exists() or temp_path.stat().st_size == 0:
-                raise Exception("Backup file was not created or is empty")
-            
-            backup_size = temp_path.stat().st_size
-            self.backup_logger.log_progress(f"Database dump created ({backup_size / (1024*1024):.2f} MB)")
-            
-            if compress:
-                self.backup_logger.log_progress("Compressing backup file")
-                compressed_file = compress_file(temp_file, backup_name + '.gz')
+            if compress and self._dump_is_precompressed():
+                logger.info(f"{db_type} dump format is already "
+                            f"compressed, skipping recompression")
+                compress = False
+
+            try:
+                compressed_file, backup_sha256 = self._stream_dump(codec if compress else None,
+                                                                   level=level)
+            except NotImplementedError:
+                logger.debug(f"{type(self.db_handler).__name__} does not support streaming dumps, "
+                             f"falling back to temp file")
+
+            if compressed_file:
                 final_backup_file = compressed_file
-                final_backup_name = backup_name + '.gz'
+                final_backup_name = backup_name + (suffix if compress else '')
             else:
-                final_backup_file = temp_file
-                final_backup_name = backup_name
-            
-            storage_type = type(self.storage_handler).__name__.lower()
-            if 'local' in storage_type:
-                storage_name = 'local'
-            elif 's3' in storage_type:
-                storage_name = 's3'
-            else:
-                storage_name = 'unknown'
-            
-            self.backup_logger.log_progress(f"Storing backup in {storage_name} storage")
-            
-            result = self.storage_handler.store_backup(final_backup_file, final_backup_name)
-            
-            duration = (datetime.now() - start_time).total_seconds()
-            final_size = Path(final_backup_file).stat().st_size
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.dump') as temp:
+                    temp_file = temp.name
+
+                self.backup_logger.log_progress("Creating database dump")
+
+                if not self.db_handler.create_backup(temp_file):
+                    raise Exception("Database backup creation failed")
+
+                try:
+                    backup_size = os.stat(temp_file).st_size
+                except FileNotFoundError:
+                    raise Exception("Backup file was not created or is empty")
+
+                if backup_size == 0:
+                    raise Exception("Backup file was not created or is empty")
+
+                self.backup_logger.log_progress_bytes("Database dump created", backup_size)
+
+                if compress and not self._sample_is_compressible(temp_file):
+                    self.backup_logger.log_warning("Dump data is effectively incompressible, "
+                                                   "storing uncompressed")
+                    compress = False
+
+                if compress:
+                    self.backup_logger.log_progress("Compressing backup file")
+                    if codec == 'zstd':
+                        compressed_file = compress_file_parallel(temp_file, backup_name + suffix,
+                                                                 codec=codec, level=level)
+                    else:
+                        compressed_file = compress_file(temp_file, backup_name + suffix,
+                                                        compresslevel=level)
+                    final_backup_file = compressed_file
+                    final_backup_name = backup_name + suffix
+                else:
+                    final_backup_file = temp_file
+                    final_backup_name = backup_name
+
+            storage_name = getattr(self.storage_handler, 'name', 'unknown')
+
+            self.backup_logger.log_progress("Storing backup in %s storage", storage_name)
             
+            result = self.storage_handler.store_backup(final_backup_file, final_backup_name,
+                                                       sha256=backup_sha256)
+
+            duration = (time.perf_counter_ns() - start_time) / 1e9
+            final_size = result['size']
+
             log_backup_metrics(
                 operation='backup',
-                database_type=self.db_handler.get_database_type(),
+                database_type=db_type,
                 database_name=self.db_handler.database,
                 backup_size=final_size,
                 duration=duration,
                 storage_type=storage_name
             )
             
-            self.backup_logger.log_success(f"Backup stored: {result}")
-            return result
+            self.backup_logger.log_success(f"Backup stored: {result['id']}")
+            return result['id']
             
         except Exception as e:
             self.backup_logger.log_error(str(e), e)
@@ -119,6 +172,109 @@ class BackupManager:
         finally:
             self._cleanup_temp_files([temp_file, compressed_file])
     
+    def _dump_is_precompressed(self) -> bool:
+        """Check whether the handler's dump format is already compressed.
+
+        mongodump archives are written with --gzip, so wrapping them in
+        gzip/zstd burns CPU for near-zero size reduction. pg_dump runs
+        with --compress=0, so its output goes through our multi-threaded
+        compressor instead of pg_dump's single-threaded zlib.
+
+        Returns:
+            True if the dump format is already compressed
+        """
+        return self.db_handler.database_type == 'mongodb'
+
+    def _sample_is_compressible(self, dump_file: str, sample_size: int = 4 * 1024 * 1024,
+                                min_reduction: float = 0.05) -> bool:
+        """Sniff whether a dump file is worth compressing.
+
+        Compresses the first few MB with a fast zlib pass and checks
+        whether the reduction clears a minimum threshold.
+
+        Args:
+            dump_file: Path to the dump file to sample
+            sample_size: Number of bytes to sample from the file head
+            min_reduction: Minimum size reduction to consider worthwhile
+
+        Returns:
+            True if the sample compresses meaningfully
+        """
+        try:
+            with open(dump_file, 'rb') as f:
+                sample = f.read(sample_size)
+
+            if not sample:
+                return True
+
+            compressor = zlib.compressobj(1)
+            compressed_len = len(compressor.compress(sample)) + len(compressor.flush())
+            reduction = 1 - compressed_len / len(sample)
+
+            logger.debug(f"Compressibility sample: {reduction:.1%} reduction on "
+                         f"{len(sample)} bytes")
+            return reduction >= min_reduction
+
+        except Exception as e:
+            logger.warning(f"Compressibility sniff failed, compressing anyway: {e}")
+            return True
+
+    def _stream_dump(self, codec: Optional[str], level: int = 3) -> Tuple[str, str]:
+        """Stream the database dump directly into a file.
+
+        The dump process output flows straight into a compressing writer
+        (or the raw file when codec is None), so the uncompressed dump
+        never lands on disk.
+
+        Args:
+            codec: Compression codec ('gzip' or 'zstd'), or None to
+                store the dump as-is
+            level: Compression level for the chosen codec
+
+        Returns:
+            Tuple of (path to the streamed backup file, SHA-256 hex digest
+            of the final file content)
+
+        Raises:
+            NotImplementedError: If the database handler cannot stream dumps
+            Exception: If the streaming backup fails
+        """
+        suffix = codec_suffix(codec) if codec else '.dump'
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp:
+            compressed_file = temp.name
+
+        self.backup_logger.log_progress("Streaming database dump into %s", codec or 'raw file')
+
+        try:
+            with open(compressed_file, 'wb', buffering=1024 * 1024) as raw:
+                # Ask the filesystem for one contiguous extent at the
+                # estimated final size instead of growing the file write
+                # by write, then trim back to the real length.
+                preallocated = preallocate(raw, self.estimate_backup_size())
+                hashing = HashingWriter(raw)
+                if codec:
+                    with open_compressor(hashing, codec, level=level) as writer:
+                        success = self.db_handler.create_backup_stream(writer)
+                else:
+                    success = self.db_handler.create_backup_stream(hashing)
+                if preallocated:
+                    raw.truncate()
+
+            if not success:
+                raise Exception("Database backup creation failed")
+
+            compressed_size = os.stat(compressed_file).st_size
+            if compressed_size == 0:
+                raise Exception("Backup file was not created or is empty")
+
+            self.backup_logger.log_progress("Compressed dump created (%d MiB, sha256=%.12s...)",
+                                            compressed_size >> 20, hashing.hexdigest())
+            return compressed_file, hashing.hexdigest()
+
+        except Exception:
+            self._cleanup_temp_files([compressed_file])
+            raise
+
     def verify_backup(self, backup_identifier: str) -> bool:
         """Verify that a backup exists and is accessible.
         
@@ -129,27 +285,39 @@ class BackupManager:
             True if backup is valid and accessible
         """
         try:
-            if hasattr(self.storage_handler, 'backup_exists'):
-                return self.storage_handler.backup_exists(backup_identifier)
-            else:
-                backups = self.storage_handler.list_backups()
-                return any(backup['name'] == backup_identifier for backup in backups)
+            return self.storage_handler.backup_exists(backup_identifier)
         except Exception as e:
             logger.error(f"Error verifying backup: {e}")
             return False
     
     def estimate_backup_size(self) -> int:
         """Estimate the size of the backup that would be created.
-        
+
+        The underlying database size query is a server round-trip, so the
+        result is cached for SIZE_CACHE_TTL seconds — status commands that
+        call get_backup_info repeatedly only pay for it once a minute.
+
         Returns:
             Estimated backup size in bytes, or 0 if unable to estimate
         """
+        now = time.perf_counter()
+        if self._size_cache is not None:
+            cached_at, cached_size = self._size_cache
+            if now - cached_at < self.SIZE_CACHE_TTL:
+                return cached_size
+
         try:
             db_size = self.db_handler.get_database_size()
             if db_size is not None:
-                estimated_compressed_size = int(db_size * 0.2)
-                return estimated_compressed_size
-            return 0
+                if self.estimated_compression_ratio is not None:
+                    estimated_size = int(db_size * self.estimated_compression_ratio)
+                else:
+                    estimated_size = db_size // 5
+            else:
+                estimated_size = 0
+
+            self._size_cache = (now, estimated_size)
+            return estimated_size
         except Exception as e:
             logger.warning(f"Unable to estimate backup size: {e}")
             return 0
@@ -162,7 +330,7 @@ class BackupManager:
         """
         return {
             'database': {
-                'type': self.db_handler.get_database_type(),
+                'type': self.db_handler.database_type,
                 'host': self.db_handler.host,
                 'port': self.db_handler.port,
                 'database': self.db_handler.database,
@@ -181,13 +349,12 @@ class BackupManager:
         Args:
             file_paths: List of file paths to clean up (can contain None values)
         """
-        for file_path in file_paths:
-            if file_path and Path(file_path).exists():
-                try:
-                    Path(file_path).unlink()
-                    logger.debug(f"Cleaned up temporary file: {file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to clean up temporary file {file_path}: {e}")
+        for file_path in filter(None, file_paths):
+            try:
+                Path(file_path).unlink(missing_ok=True)
+                logger.debug(f"Cleaned up temporary file: {file_path}")
+            except OSError as e:
+                logger.warning(f"Failed to clean up temporary file {file_path}: {e}")
     
     def __str__(self) -> str:
         """String representation of backup manager."""
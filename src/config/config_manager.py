@@ -2,21 +2,122 @@
 Configuration manager for dbVault
 """
 
+import copy
+import hashlib
 import os
+import pickle
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+CONFIG_SCHEMA = {
+    'type': 'object',
+    'required': ['database', 'storage'],
+    'properties': {
+        'database': {
+            'type': 'object',
+            'required': ['type', 'host', 'username', 'database'],
+            'properties': {
+                'type': {'enum': ['postgresql', 'mongodb']},
+            },
+        },
+        'storage': {
+            'type': 'object',
+            'anyOf': [
+                {'required': ['local']},
+                {'required': ['aws']},
+            ],
+            'properties': {
+                'local': {
+                    'type': 'object',
+                    'required': ['path'],
+                },
+                'aws': {
+                    'type': 'object',
+                    'required': ['bucket', 'region'],
+                },
+            },
+        },
+    },
+}
+
+# Compile the schema once at import time; the generated validator is
+# straight-line code instead of a tree walk per load_config call.
+_VALIDATE_CONFIG = fastjsonschema.compile(CONFIG_SCHEMA) if fastjsonschema else None
+
+# Load .env once at import time — load_dotenv stats for .env from cwd
+# upward and mutates os.environ globally, so repeating it per
+# ConfigManager instance only burns syscalls.
+_DOTENV_LOADED = load_dotenv()
+
+# Parsed-YAML caches keyed on (mtime_ns, size): _CONFIG_CACHE memoizes
+# within the process, and a pickle sidecar under the user cache dir
+# skips the YAML parse across CLI invocations. Only the raw parsed tree
+# is cached — env-var resolution and validation still run on every
+# load so environment changes take effect immediately.
+_CONFIG_CACHE: Dict[str, Any] = {}
+
+
+def _config_cache_path(config_file) -> Path:
+    """Build the on-disk cache path for a config file's parse result.
+
+    Keyed on the path alone — the (mtime, size) stamp lives inside the
+    entry — so editing a config overwrites its one sidecar instead of
+    accumulating a new file per change.
+
+    Args:
+        config_file: Absolute path to the configuration file
+
+    Returns:
+        Path of the pickle cache entry
+    """
+    key = hashlib.sha1(str(config_file).encode()).hexdigest()
+    cache_root = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    return cache_root / 'dbvault' / f"{key}.pkl"
+
+
+@lru_cache(maxsize=None)
+def get_config(config_path: str) -> Dict[str, Any]:
+    """Load a configuration file once per process.
+
+    Commands driven from scripts re-enter load_config with the same
+    path; this memoizes the fully resolved result for the process
+    lifetime. Callers must treat the returned dictionary as read-only.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Dictionary containing the resolved configuration
+    """
+    return ConfigManager().load_config(config_path)
+
 
 class ConfigManager:
     """Manages configuration files and environment variables."""
-    
+
+    __slots__ = ()
+
+    _ENV_VAR_RE = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}')
+
     DEFAULT_CONFIG = {
         'database': {
             'type': 'postgresql',
@@ -39,14 +140,13 @@ class ConfigManager:
         },
         'backup': {
             'compression': True,
+            'compression_codec': 'zstd',
+            'compression_level': 3,
+            'estimated_compression_ratio': 0.2,
             'default_storage': 'local'
         }
     }
     
-    def __init__(self):
-        """Initialize the configuration manager."""
-        load_dotenv()
-        
     def create_default_config(self, config_path: Path) -> None:
         """Create a default configuration file.
         
@@ -55,7 +155,7 @@ class ConfigManager:
         """
         try:
             with open(config_path, 'w') as f:
-                yaml.dump(self.DEFAULT_CONFIG, f, default_flow_style=False, indent=2)
+                yaml.dump(self.DEFAULT_CONFIG, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
             logger.info(f"Created default configuration file: {config_path}")
         except Exception as e:
             logger.error(f"Failed to create configuration file: {e}")
@@ -75,60 +175,123 @@ class ConfigManager:
             yaml.YAMLError: If configuration file is invalid
         """
         config_file = Path(config_path)
-        
+
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        
+
         try:
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
-            
+            config = self._load_parsed(config_file)
+
             config = self._resolve_env_vars(config)
-            
+
             self._validate_config(config)
-            
+
             logger.info(f"Loaded configuration from: {config_path}")
             return config
-            
+
         except yaml.YAMLError as e:
             logger.error(f"Invalid YAML in configuration file: {e}")
             raise
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
             raise
+
+    def _load_parsed(self, config_file: Path) -> Dict[str, Any]:
+        """Get the parsed (unresolved) YAML tree for a config file.
+
+        Serves from the in-process memo or the pickle sidecar when the
+        file's mtime and size are unchanged; otherwise parses the YAML
+        and refreshes both caches. Callers always receive a private copy
+        since env-var resolution mutates the tree in place.
+
+        Args:
+            config_file: Path to the configuration file
+
+        Returns:
+            Parsed configuration tree
+        """
+        stat = config_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = str(config_file.resolve())
+
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+
+        cache_path = _config_cache_path(key)
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_stamp, config = pickle.load(f)
+            if cached_stamp == stamp:
+                _CONFIG_CACHE[key] = (stamp, config)
+                return copy.deepcopy(config)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            pass
+
+        with open(config_file, 'r') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+
+        _CONFIG_CACHE[key] = (stamp, config)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump((stamp, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Unable to write config parse cache: {e}")
+
+        return copy.deepcopy(config)
     
+    def _expand_env_vars(self, value: str) -> str:
+        """Expand ${VAR} and ${VAR:-default} references in a string.
+
+        Args:
+            value: String possibly containing environment variable references
+
+        Returns:
+            String with all references expanded
+        """
+        def replace(match: 're.Match') -> str:
+            env_var = match.group(1)
+            env_value = os.getenv(env_var)
+            if env_value is not None:
+                return env_value
+
+            default_value = match.group(2)
+            if default_value is not None:
+                logger.debug(f"Environment variable {env_var} not found, using default: {default_value}")
+                return default_value
+
+            logger.warning(f"Environment variable {env_var} not found, using original value")
+            return match.group(0)
+
+        return self._ENV_VAR_RE.sub(replace, value)
+
     def _resolve_env_vars(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively resolve environment variables in configuration.
-        
+        """Resolve environment variables in configuration.
+
+        Walks the parsed tree with an explicit stack and expands each
+        string with a single compiled-regex pass, so references embedded
+        inside larger strings (e.g. "prefix-${VAR}-suffix") are expanded
+        as well.
+
         Args:
             config: Configuration dictionary
-            
+
         Returns:
             Configuration with environment variables resolved
         """
-        if isinstance(config, dict):
-            return {k: self._resolve_env_vars(v) for k, v in config.items()}
-        elif isinstance(config, list):
-            return [self._resolve_env_vars(item) for item in config]
-        elif isinstance(config, str) and config.startswith('${') and config.endswith('}'):
-            env_expression = config[2:-1]
-            
-            if ':-' in env_expression:
-                env_var, default_value = env_expression.split(':-', 1)
-                value = os.getenv(env_var)
-                if value is None:
-                    logger.debug(f"Environment variable {env_var} not found, using default: {default_value}")
-                    return default_value
-                return value
-            else:
-                env_var = env_expression
-                value = os.getenv(env_var)
-                if value is None:
-                    logger.warning(f"Environment variable {env_var} not found, using original value")
-                    return config
-                return value
-        else:
-            return config
+        stack = [config]
+        while stack:
+            node = stack.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+
+            for key, value in items:
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+                elif isinstance(value, str) and '$' in value:
+                    node[key] = self._expand_env_vars(value)
+
+        return config
     
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """Validate configuration structure and required fields.
@@ -136,6 +299,34 @@ class ConfigManager:
         Args:
             config: Configuration dictionary to validate
             
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        if _VALIDATE_CONFIG is not None:
+            try:
+                _VALIDATE_CONFIG(config)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(f"Invalid configuration: {e.message}")
+        else:
+            self._validate_config_fallback(config)
+
+        db_config = config['database']
+        if 'port' not in db_config:
+            if db_config['type'] == 'postgresql':
+                db_config['port'] = 5432
+            elif db_config['type'] == 'mongodb':
+                db_config['port'] = 27017
+
+        logger.info("Configuration validation passed")
+
+    def _validate_config_fallback(self, config: Dict[str, Any]) -> None:
+        """Validate configuration with hand-rolled checks.
+
+        Used when fastjsonschema is not installed; mirrors CONFIG_SCHEMA.
+
+        Args:
+            config: Configuration dictionary to validate
+
         Raises:
             ValueError: If configuration is invalid
         """
@@ -143,41 +334,33 @@ class ConfigManager:
         for section in required_sections:
             if section not in config:
                 raise ValueError(f"Missing required configuration section: {section}")
-        
+
         db_config = config['database']
         required_db_fields = ['type', 'host', 'username', 'database']
         for field in required_db_fields:
             if field not in db_config:
                 raise ValueError(f"Missing required database field: {field}")
-        
+
         supported_db_types = ['postgresql', 'mongodb']
         if db_config['type'] not in supported_db_types:
             raise ValueError(f"Unsupported database type: {db_config['type']}. "
                            f"Supported types: {', '.join(supported_db_types)}")
-        
-        if 'port' not in db_config:
-            if db_config['type'] == 'postgresql':
-                db_config['port'] = 5432
-            elif db_config['type'] == 'mongodb':
-                db_config['port'] = 27017
-        
+
         storage_config = config['storage']
         if 'local' not in storage_config and 'aws' not in storage_config:
             raise ValueError("At least one storage backend (local or aws) must be configured")
-        
+
         if 'aws' in storage_config:
             aws_config = storage_config['aws']
             required_aws_fields = ['bucket', 'region']
             for field in required_aws_fields:
                 if field not in aws_config:
                     raise ValueError(f"Missing required AWS storage field: {field}")
-        
+
         if 'local' in storage_config:
             local_config = storage_config['local']
             if 'path' not in local_config:
                 raise ValueError("Missing required local storage field: path")
-        
-        logger.info("Configuration validation passed")
     
     def get_database_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Get database configuration section.
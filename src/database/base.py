@@ -2,16 +2,53 @@
 Abstract base class for database handlers
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+
+def run_backups(handlers: List['DatabaseHandler'], output_files: List[str],
+                max_concurrency: int = 4) -> List[bool]:
+    """Run backups for several handlers with bounded parallelism.
+
+    Each dump runs in its own external tool process, so overlapping them
+    uses otherwise-idle cores and I/O; the semaphore keeps the number of
+    simultaneous dumps from overwhelming the host.
+
+    Args:
+        handlers: Database handlers to back up
+        output_files: Output path per handler (same order)
+        max_concurrency: Maximum number of dumps running at once
+
+    Returns:
+        Per-handler success flags, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(handler: 'DatabaseHandler', output_file: str) -> bool:
+        async with semaphore:
+            return await handler.create_backup_async(output_file)
+
+    async def _all() -> List[bool]:
+        return list(await asyncio.gather(
+            *(_one(h, f) for h, f in zip(handlers, output_files))
+        ))
+
+    return asyncio.run(_all())
 
 
 class DatabaseHandler(ABC):
     """Abstract base class for database handlers."""
-    
+
+    # Slots drop the per-instance __dict__: attributes like host and
+    # database are read on every log line and backup iteration, and a
+    # slot lookup is a fixed offset instead of a dict probe.
+    __slots__ = ('config', 'host', 'port', 'username', 'password', 'database',
+                 '_database_type', '_conn_str_masked', '_conn_str_plain')
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the database handler.
-        
+
         Args:
             config: Database configuration dictionary
         """
@@ -21,6 +58,9 @@ class DatabaseHandler(ABC):
         self.username = config['username']
         self.password = config.get('password', '')
         self.database = config['database']
+        self._database_type = None
+        self._conn_str_masked = None
+        self._conn_str_plain = None
     
     @abstractmethod
     def test_connection(self) -> bool:
@@ -43,6 +83,73 @@ class DatabaseHandler(ABC):
         """
         pass
     
+    def create_backup_stream(self, fileobj) -> bool:
+        """Stream a backup of the database into a writable file object.
+
+        Handlers that can dump to stdout override this to pipe the dump
+        process directly into the caller's file object, avoiding an
+        intermediate uncompressed file on disk.
+
+        Args:
+            fileobj: Writable binary file object to receive the dump
+
+        Returns:
+            True if backup was successful, False otherwise
+
+        Raises:
+            NotImplementedError: If the handler does not support streaming
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support streaming backups"
+        )
+
+    def restore_backup_stream(self, fileobj) -> bool:
+        """Restore the database from a readable dump stream.
+
+        Handlers whose restore tool can read from stdin override this to
+        consume the stream directly, so a compressed backup is unpacked
+        inline instead of being staged as a decompressed temp file.
+
+        Args:
+            fileobj: Readable binary file object yielding the dump
+
+        Returns:
+            True if restore was successful, False otherwise
+
+        Raises:
+            NotImplementedError: If the handler does not support streaming
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support streaming restores"
+        )
+
+    async def create_backup_async(self, output_file: str) -> bool:
+        """Create a backup without blocking the event loop.
+
+        The dump work happens in external tool processes either way, so
+        the blocking create_backup is dispatched to a worker thread —
+        an orchestrator can fan out several handlers under a semaphore
+        (see run_backups) while each dump tool runs.
+
+        Args:
+            output_file: Path where the backup file should be created
+
+        Returns:
+            True if backup was successful, False otherwise
+        """
+        return await asyncio.to_thread(self.create_backup, output_file)
+
+    async def restore_backup_async(self, backup_file: str) -> bool:
+        """Restore a backup without blocking the event loop.
+
+        Args:
+            backup_file: Path to the backup file
+
+        Returns:
+            True if restore was successful, False otherwise
+        """
+        return await asyncio.to_thread(self.restore_backup, backup_file)
+
     @abstractmethod
     def restore_backup(self, backup_file: str) -> bool:
         """Restore the database from a backup file.
@@ -64,17 +171,33 @@ class DatabaseHandler(ABC):
         """
         pass
     
+    @property
+    def database_type(self) -> str:
+        """Database type identifier, cached after the first lookup."""
+        if self._database_type is None:
+            self._database_type = self.get_database_type()
+        return self._database_type
+
     def get_connection_string(self, mask_password: bool = True) -> str:
         """Get a string representation of the database connection.
-        
+
         Args:
             mask_password: Whether to mask the password in the string
-            
+
         Returns:
             Connection string
         """
-        password = "***" if mask_password and self.password else self.password
-        return f"{self.get_database_type()}://{self.username}:{password}@{self.host}:{self.port}/{self.database}"
+        if mask_password:
+            if self._conn_str_masked is None:
+                password = "***" if self.password else self.password
+                self._conn_str_masked = (f"{self.database_type}://{self.username}:{password}"
+                                         f"@{self.host}:{self.port}/{self.database}")
+            return self._conn_str_masked
+
+        if self._conn_str_plain is None:
+            self._conn_str_plain = (f"{self.database_type}://{self.username}:{self.password}"
+                                    f"@{self.host}:{self.port}/{self.database}")
+        return self._conn_str_plain
     
     @abstractmethod
     def get_database_type(self) -> str:
@@ -2,73 +2,120 @@
 Database factory for creating database handlers
 """
 
+import importlib
 from typing import Dict, Any
 
 from .base import DatabaseHandler
-from .postgresql import PostgreSQLHandler
-from .mongodb import MongoDBHandler
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _freeze(value):
+    """Convert a config value into a hashable cache key.
+
+    Args:
+        value: Dictionary, list or scalar from a parsed config
+
+    Returns:
+        Hashable representation with stable ordering
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class DatabaseFactory:
     """Factory class for creating database handlers."""
-    
+
+    # Handlers are registered as "module:class" dotted paths so that the
+    # heavy database drivers (psycopg2, pymongo) are only imported when a
+    # handler of that type is actually requested. Resolved classes are
+    # cached back into the registry.
     _handlers = {
-        'postgresql': PostgreSQLHandler,
-        'postgres': PostgreSQLHandler,
-        'mongodb': MongoDBHandler,
-        'mongo': MongoDBHandler,
+        'postgresql': '.postgresql:PostgreSQLHandler',
+        'postgres': '.postgresql:PostgreSQLHandler',
+        'mongodb': '.mongodb:MongoDBHandler',
+        'mongo': '.mongodb:MongoDBHandler',
     }
-    
+
+    # Handlers cache their server connections, so identical configs
+    # within one process share an instance instead of re-dialing.
+    _instances: Dict[Any, DatabaseHandler] = {}
+
+    @classmethod
+    def _resolve_handler(cls, db_type: str) -> type:
+        """Resolve a registry entry to a handler class, importing lazily.
+
+        Args:
+            db_type: Database type identifier (must exist in the registry)
+
+        Returns:
+            Handler class
+        """
+        entry = cls._handlers[db_type]
+        if isinstance(entry, str):
+            module_path, class_name = entry.split(':')
+            module = importlib.import_module(module_path, package=__package__)
+            entry = getattr(module, class_name)
+            cls._handlers[db_type] = entry
+        return entry
+
     @classmethod
     def create_handler(cls, config: Dict[str, Any]) -> DatabaseHandler:
         """Create a database handler based on the configuration.
-        
+
         Args:
             config: Database configuration dictionary
-            
+
         Returns:
             Database handler instance
-            
+
         Raises:
             ValueError: If database type is not supported
         """
         if 'type' not in config:
             raise ValueError("Database type not specified in configuration")
-        
+
         db_type = config['type'].lower()
-        
+
         if db_type not in cls._handlers:
             supported_types = list(cls._handlers.keys())
             raise ValueError(f"Unsupported database type: {db_type}. "
                            f"Supported types: {', '.join(supported_types)}")
-        
-        handler_class = cls._handlers[db_type]
-        logger.info(f"Creating {handler_class.__name__} for database: {config.get('database', 'unknown')}")
-        
-        return handler_class(config)
-    
+
+        handler_class = cls._resolve_handler(db_type)
+
+        key = (handler_class, _freeze(config))
+        handler = cls._instances.get(key)
+        if handler is None:
+            logger.info(f"Creating {handler_class.__name__} for database: {config.get('database', 'unknown')}")
+            handler = handler_class(config)
+            cls._instances[key] = handler
+
+        return handler
+
     @classmethod
     def get_supported_types(cls) -> list:
         """Get list of supported database types.
-        
+
         Returns:
             List of supported database type strings
         """
         return list(cls._handlers.keys())
-    
+
     @classmethod
     def register_handler(cls, db_type: str, handler_class: type) -> None:
         """Register a new database handler.
-        
+
         Args:
             db_type: Database type identifier
             handler_class: Handler class that inherits from DatabaseHandler
         """
         if not issubclass(handler_class, DatabaseHandler):
             raise ValueError("Handler class must inherit from DatabaseHandler")
-        
+
         cls._handlers[db_type.lower()] = handler_class
         logger.info(f"Registered new database handler: {db_type} -> {handler_class.__name__}")
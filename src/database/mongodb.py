@@ -2,6 +2,7 @@
 MongoDB database handler
 """
 
+import gzip
 import subprocess
 import os
 import json
@@ -13,23 +14,31 @@ from pymongo.errors import ConnectionFailure, PyMongoError
 
 from .base import DatabaseHandler
 from ..utils.logging import get_logger, BackupLogger
+from ..utils.proc import preallocate, run_tool
 
 logger = get_logger(__name__)
 
 
 class MongoDBHandler(DatabaseHandler):
     """Handler for MongoDB databases."""
-    
+
+    __slots__ = ('auth_database', 'connection_uri', 'backup_logger',
+                 'parallel_collections', 'insertion_workers', '_client',
+                 '_conn_args')
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize MongoDB handler.
-        
+
         Args:
             config: Database configuration dictionary
         """
         super().__init__(config)
         self.validate_config()
-        
+
         self.auth_database = config.get('auth_database', self.database)
+        self.parallel_collections = config.get('parallel_collections',
+                                               max(4, os.cpu_count() or 1))
+        self.insertion_workers = config.get('insertion_workers', 4)
         
         if self.password:
             self.connection_uri = f"mongodb://{self.username}:{self.password}@{self.host}:{self.port}/{self.auth_database}"
@@ -37,10 +46,73 @@ class MongoDBHandler(DatabaseHandler):
             self.connection_uri = f"mongodb://{self.host}:{self.port}/{self.auth_database}"
         
         self.backup_logger = BackupLogger(__name__)
-        
+        self._client = None
+
+        # Config is immutable for the handler's lifetime, so the
+        # connection and auth arguments shared by every mongodump and
+        # mongorestore invocation are evaluated once here.
+        conn_args = ['--host', f"{self.host}:{self.port}"]
+        if self.username:
+            conn_args.extend(['--username', str(self.username)])
+        if self.password:
+            conn_args.extend(['--password', str(self.password)])
+        if self.username and self.auth_database:
+            conn_args.extend(['--authenticationDatabase', str(self.auth_database)])
+        self._conn_args = tuple(conn_args)
+
         if self.auth_database != self.database:
             logger.info(f"Using authentication database: {self.auth_database} for database: {self.database}")
     
+    def _get_client(self) -> MongoClient:
+        """Get the shared MongoClient, creating it on first use.
+
+        A MongoClient owns a connection pool, so reusing one across
+        test_connection/get_database_size/get_collections avoids paying
+        the TLS/auth handshake for every call.
+
+        Returns:
+            Cached MongoClient instance
+        """
+        if self._client is None:
+            # Single-host tooling: skip topology discovery and retry
+            # handshakes, and fail fast when the server is unreachable.
+            self._client = MongoClient(
+                self.connection_uri,
+                maxPoolSize=4,
+                serverSelectionTimeoutMS=2000,
+                connectTimeoutMS=2000,
+                socketTimeoutMS=2000,
+                directConnection=True,
+                retryReads=False,
+                retryWrites=False
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close the cached MongoClient, if any."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _tool_env(self) -> Dict[str, str]:
+        """Build the environment for mongodump/mongorestore processes.
+
+        Sets GOMAXPROCS explicitly so the Go-based tools schedule across
+        all cores regardless of the inherited environment.
+
+        Returns:
+            Environment mapping for the subprocess
+        """
+        env = os.environ.copy()
+        env.setdefault('GOMAXPROCS', str(os.cpu_count() or 1))
+        return env
+
     def test_connection(self) -> bool:
         """Test MongoDB connection.
         
@@ -48,12 +120,11 @@ class MongoDBHandler(DatabaseHandler):
             True if connection is successful, False otherwise
         """
         try:
-            client = MongoClient(self.connection_uri, serverSelectionTimeoutMS=5000)
-            
-            db = client[self.database]
-            db.command('ping')
-            
-            client.close()
+            # 'hello' on admin skips the per-database auth context switch
+            # and is the same check the driver's topology monitor runs,
+            # so the answer is usually already hot.
+            self._get_client().admin.command('hello')
+
             logger.info(f"MongoDB connection test successful: {self.host}:{self.port}/{self.database}")
             return True
         except ConnectionFailure as e:
@@ -77,69 +148,51 @@ class MongoDBHandler(DatabaseHandler):
         try:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            temp_dir = output_path.parent / f"temp_mongodump_{self.database}"
-            temp_dir.mkdir(exist_ok=True)
-            
+
             cmd = [
                 'mongodump',
-                '--host', f"{self.host}:{str(self.port)}",
+                *self._conn_args,
                 '--db', self.database,
-                '--out', str(temp_dir)
+                '--archive',
+                '--gzip',
+                '--numParallelCollections', str(self.parallel_collections)
             ]
-            
-            if self.username:
-                cmd.extend(['--username', str(self.username)])
-            if self.password:
-                cmd.extend(['--password', str(self.password)])
-            if self.username and self.auth_database:
-                cmd.extend(['--authenticationDatabase', str(self.auth_database)])
-            
+
             self.backup_logger.log_progress("Executing mongodump command")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600
-            )
-            
-            if result.returncode == 0:
-                self.backup_logger.log_progress("Creating backup archive")
-                
-                tar_cmd = [
-                    'tar',
-                    '-czf', str(output_path),
-                    '-C', str(temp_dir),
-                    self.database
-                ]
-                
-                tar_result = subprocess.run(
-                    tar_cmd,
-                    capture_output=True,
-                    text=True
+
+            # Stream the gzipped archive straight to the output file:
+            # compression overlaps with the dump and the uncompressed
+            # BSON never touches disk. Pre-allocating the file at the
+            # expected compressed size (~30% of the data) keeps its
+            # extents contiguous; the surplus is trimmed afterwards via
+            # the file offset shared with the mongodump process.
+            estimated_size = self.get_database_size() or 0
+
+            with open(output_path, 'wb') as archive:
+                preallocated = preallocate(archive, (estimated_size * 3) // 10)
+                returncode, stderr_text = run_tool(
+                    cmd,
+                    env=self._tool_env(),
+                    timeout=3600,
+                    stdout=archive
                 )
-                
-                if tar_result.returncode == 0:
-                    self._cleanup_directory(temp_dir)
-                    
-                    backup_size = output_path.stat().st_size if output_path.exists() else 0
-                    size_mb = backup_size / (1024 * 1024)
-                    
-                    self.backup_logger.log_success(f"Backup created: {output_file} ({size_mb:.2f} MB)")
-                    return True
-                else:
-                    self._cleanup_directory(temp_dir)
-                    self.backup_logger.log_error(f"Failed to create backup archive: {tar_result.stderr}")
-                    return False
+                if preallocated:
+                    os.ftruncate(archive.fileno(),
+                                 os.lseek(archive.fileno(), 0, os.SEEK_CUR))
+
+            if returncode == 0:
+                backup_size = output_path.stat().st_size if output_path.exists() else 0
+                size_mb = backup_size / (1024 * 1024)
+
+                self.backup_logger.log_success(f"Backup created: {output_file} ({size_mb:.2f} MB)")
+                return True
             else:
-                self._cleanup_directory(temp_dir)
-                error_msg = f"mongodump failed with return code {result.returncode}"
-                if result.stderr:
-                    error_msg += f": {result.stderr}"
+                error_msg = f"mongodump failed with return code {returncode}"
+                if stderr_text:
+                    error_msg += f": {stderr_text}"
                 self.backup_logger.log_error(error_msg)
                 return False
-                
+
         except subprocess.TimeoutExpired:
             self.backup_logger.log_error("Backup operation timed out after 1 hour")
             return False
@@ -150,88 +203,271 @@ class MongoDBHandler(DatabaseHandler):
             self.backup_logger.log_error(f"Unexpected error during backup: {e}", e)
             return False
     
+    def _oplog_state_path(self) -> Path:
+        """Get the path of the sidecar file recording the last oplog position.
+
+        Returns:
+            Path to the oplog state JSON file
+        """
+        default = Path.home() / '.dbvault' / f"{self.database}_oplog_state.json"
+        return Path(self.config.get('oplog_state_file', default)).expanduser()
+
+    def _load_oplog_state(self) -> Optional[Dict[str, int]]:
+        """Load the last recorded oplog timestamp, if any.
+
+        Returns:
+            Dictionary with 't' (seconds) and 'i' (ordinal), or None when
+            no baseline backup has been recorded yet
+        """
+        try:
+            with open(self._oplog_state_path()) as f:
+                state = json.load(f)
+            if 't' in state and 'i' in state:
+                return state
+        except (FileNotFoundError, ValueError):
+            pass
+        return None
+
+    def _save_oplog_state(self, timestamp) -> None:
+        """Persist the oplog timestamp reached by the latest backup.
+
+        Args:
+            timestamp: bson.Timestamp of the newest captured oplog entry
+        """
+        state_path = self._oplog_state_path()
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(state_path, 'w') as f:
+            json.dump({'t': timestamp.time, 'i': timestamp.inc}, f)
+        logger.debug(f"Recorded oplog position {timestamp.time}:{timestamp.inc} in {state_path}")
+
+    def _latest_oplog_timestamp(self):
+        """Read the newest oplog entry's timestamp from the server.
+
+        Returns:
+            bson.Timestamp of the latest oplog entry, or None when the
+            oplog is unavailable (e.g. standalone server)
+        """
+        try:
+            oplog = self._get_client().local['oplog.rs']
+            entry = oplog.find_one(sort=[('$natural', -1)])
+            return entry['ts'] if entry else None
+        except PyMongoError as e:
+            logger.warning(f"Unable to read oplog position: {e}")
+            return None
+
+    def create_incremental_backup(self, output_file: str) -> bool:
+        """Create an incremental backup of oplog entries since the last run.
+
+        Instead of re-dumping the whole database, only oplog entries newer
+        than the position recorded by the previous backup are archived —
+        O(changes) instead of O(total size). Falls back to a full dump
+        when no baseline exists or the server has no oplog, recording the
+        current oplog position either way so the next run can be
+        incremental.
+
+        Args:
+            output_file: Path where the backup archive should be created
+
+        Returns:
+            True if backup was successful, False otherwise
+        """
+        last_state = self._load_oplog_state()
+        current_ts = self._latest_oplog_timestamp()
+
+        if last_state is None or current_ts is None:
+            logger.info("No oplog baseline available, creating full backup")
+            if not self.create_backup(output_file):
+                return False
+            if current_ts is not None:
+                self._save_oplog_state(current_ts)
+            return True
+
+        self.backup_logger.start_operation(
+            "backup", f"MongoDB database: {self.database} (incremental)")
+
+        try:
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            query = json.dumps({
+                'ts': {'$gt': {'$timestamp': {'t': last_state['t'], 'i': last_state['i']}}}
+            })
+
+            cmd = [
+                'mongodump',
+                *self._conn_args,
+                '--db', 'local',
+                '--collection', 'oplog.rs',
+                '--query', query,
+                '--archive',
+                '--gzip'
+            ]
+
+            self.backup_logger.log_progress("Dumping oplog entries since %d:%d",
+                                            last_state['t'], last_state['i'])
+
+            with open(output_path, 'wb') as archive:
+                returncode, stderr_text = run_tool(
+                    cmd,
+                    env=self._tool_env(),
+                    timeout=3600,
+                    stdout=archive
+                )
+
+            if returncode != 0:
+                error_msg = f"mongodump failed with return code {returncode}"
+                if stderr_text:
+                    error_msg += f": {stderr_text}"
+                self.backup_logger.log_error(error_msg)
+                return False
+
+            self._save_oplog_state(current_ts)
+
+            backup_size = output_path.stat().st_size if output_path.exists() else 0
+            self.backup_logger.log_success(
+                f"Incremental backup created: {output_file} ({backup_size / (1024 * 1024):.2f} MB)")
+            return True
+
+        except subprocess.TimeoutExpired:
+            self.backup_logger.log_error("Backup operation timed out after 1 hour")
+            return False
+        except FileNotFoundError:
+            self.backup_logger.log_error("mongodump command not found. Please ensure MongoDB tools are installed.")
+            return False
+        except Exception as e:
+            self.backup_logger.log_error(f"Unexpected error during incremental backup: {e}", e)
+            return False
+
+    def replay_oplog_backup(self, backup_file: str) -> bool:
+        """Replay an incremental oplog archive on top of a restored baseline.
+
+        Args:
+            backup_file: Path to the incremental backup archive
+
+        Returns:
+            True if replay was successful, False otherwise
+        """
+        self.backup_logger.start_operation(
+            "restore", f"MongoDB database: {self.database} (oplog replay)")
+
+        try:
+            backup_path = Path(backup_file)
+            if not backup_path.exists():
+                self.backup_logger.log_error(f"Backup file not found: {backup_file}")
+                return False
+
+            cmd = [
+                'mongorestore',
+                *self._conn_args,
+                '--archive=' + str(backup_path),
+                '--gzip',
+                '--oplogReplay'
+            ]
+
+            self.backup_logger.log_progress("Replaying oplog entries")
+
+            returncode, stderr_text = run_tool(cmd, env=self._tool_env(), timeout=3600)
+
+            if returncode == 0:
+                self.backup_logger.log_success(f"Oplog replayed from: {backup_file}")
+                return True
+            else:
+                error_msg = f"mongorestore failed with return code {returncode}"
+                if stderr_text:
+                    error_msg += f": {stderr_text}"
+                self.backup_logger.log_error(error_msg)
+                return False
+
+        except subprocess.TimeoutExpired:
+            self.backup_logger.log_error("Restore operation timed out after 1 hour")
+            return False
+        except FileNotFoundError:
+            self.backup_logger.log_error("mongorestore command not found. Please ensure MongoDB tools are installed.")
+            return False
+        except Exception as e:
+            self.backup_logger.log_error(f"Unexpected error during oplog replay: {e}", e)
+            return False
+
+    def _has_outer_gzip_layer(self, backup_file: str) -> bool:
+        """Check whether a backup was gzip-compressed a second time.
+
+        Older backups were compressed again after mongodump, so the
+        mongodump --gzip archive sits inside an outer gzip layer that
+        mongorestore cannot unwrap on its own.
+
+        Args:
+            backup_file: Path to the backup archive file
+
+        Returns:
+            True if the file decompresses to another gzip stream
+        """
+        try:
+            with gzip.open(backup_file, 'rb') as f:
+                return f.read(2) == b'\x1f\x8b'
+        except OSError:
+            return False
+
     def restore_backup(self, backup_file: str) -> bool:
         """Restore MongoDB database from backup using mongorestore.
-        
+
         Args:
             backup_file: Path to the backup archive file
-            
+
         Returns:
             True if restore was successful, False otherwise
         """
         self.backup_logger.start_operation("restore", f"MongoDB database: {self.database}")
-        
+
         try:
             backup_path = Path(backup_file)
             if not backup_path.exists():
                 self.backup_logger.log_error(f"Backup file not found: {backup_file}")
                 return False
-            
-            temp_dir = backup_path.parent / f"temp_mongorestore_{self.database}"
-            temp_dir.mkdir(exist_ok=True)
-            
-            self.backup_logger.log_progress("Extracting backup archive")
-            
-            tar_cmd = [
-                'tar',
-                '-xzf', str(backup_path),
-                '-C', str(temp_dir)
-            ]
-            
-            tar_result = subprocess.run(
-                tar_cmd,
-                capture_output=True,
-                text=True
-            )
-            
-            if tar_result.returncode != 0:
-                self._cleanup_directory(temp_dir)
-                self.backup_logger.log_error(f"Failed to extract backup archive: {tar_result.stderr}")
-                return False
-            
-            extracted_dirs = [d for d in temp_dir.iterdir() if d.is_dir()]
-            if not extracted_dirs:
-                self._cleanup_directory(temp_dir)
-                self.backup_logger.log_error("No database directory found in backup archive")
-                return False
-            
-            database_backup_dir = extracted_dirs[0]
-            
+
+            # Legacy doubly-compressed backups are unwrapped by piping
+            # gunzip straight into mongorestore's stdin — no staged
+            # decompressed copy on disk, no 2x free-space requirement.
+            pipe_outer_layer = self._has_outer_gzip_layer(backup_file)
+
             cmd = [
                 'mongorestore',
-                '--host', f"{self.host}:{str(self.port)}",
+                *self._conn_args,
                 '--db', self.database,
+                '--archive' if pipe_outer_layer else '--archive=' + str(backup_path),
+                '--gzip',
                 '--drop',
-                str(database_backup_dir)
+                '--numParallelCollections', str(self.parallel_collections),
+                '--numInsertionWorkersPerCollection', str(self.insertion_workers)
             ]
-            
-            if self.username:
-                cmd.extend(['--username', str(self.username)])
-            if self.password:
-                cmd.extend(['--password', str(self.password)])
-            if self.username and self.auth_database:
-                cmd.extend(['--authenticationDatabase', str(self.auth_database)])
-            
+
             self.backup_logger.log_progress("Executing mongorestore command")
-            
+
             logger.debug(f"mongorestore command: {cmd}")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600
-            )
-            
-            self._cleanup_directory(temp_dir)
-            
-            if result.returncode == 0:
+
+            if pipe_outer_layer:
+                with open(backup_path, 'rb') as raw:
+                    gunzip = subprocess.Popen(['gunzip', '-c'], stdin=raw,
+                                              stdout=subprocess.PIPE)
+                    try:
+                        returncode, stderr_text = run_tool(
+                            cmd,
+                            env=self._tool_env(),
+                            timeout=3600,
+                            stdin=gunzip.stdout
+                        )
+                    finally:
+                        gunzip.stdout.close()
+                        gunzip.wait()
+            else:
+                returncode, stderr_text = run_tool(cmd, env=self._tool_env(), timeout=3600)
+
+            if returncode == 0:
                 self.backup_logger.log_success(f"Database restored from: {backup_file}")
                 return True
             else:
-                error_msg = f"mongorestore failed with return code {result.returncode}"
-                if result.stderr:
-                    error_msg += f": {result.stderr}"
+                error_msg = f"mongorestore failed with return code {returncode}"
+                if stderr_text:
+                    error_msg += f": {stderr_text}"
                 self.backup_logger.log_error(error_msg)
                 return False
                 
@@ -252,13 +488,14 @@ class MongoDBHandler(DatabaseHandler):
             Database size in bytes, or None if unable to determine
         """
         try:
-            client = MongoClient(self.connection_uri)
-            db = client[self.database]
-            
-            stats = db.command("dbStats")
+            db = self._get_client()[self.database]
+
+            # scale=1 with freeStorage off skips the free-block
+            # accounting pass, which is the expensive part on large
+            # databases.
+            stats = db.command({'dbStats': 1, 'scale': 1, 'freeStorage': 0})
             size = stats.get('dataSize', 0) + stats.get('indexSize', 0)
-            
-            client.close()
+
             logger.debug(f"MongoDB database size: {size} bytes")
             return size
             
@@ -284,32 +521,16 @@ class MongoDBHandler(DatabaseHandler):
             List of collection names, or None if unable to retrieve
         """
         try:
-            client = MongoClient(self.connection_uri)
-            db = client[self.database]
-            
+            db = self._get_client()[self.database]
+
             collections = db.list_collection_names()
-            client.close()
-            
+
             return collections
             
         except PyMongoError as e:
             logger.error(f"Failed to get collection list: {e}")
             return None
     
-    def _cleanup_directory(self, directory: Path) -> None:
-        """Remove directory and all its contents.
-        
-        Args:
-            directory: Directory path to remove
-        """
-        try:
-            import shutil
-            if directory.exists():
-                shutil.rmtree(directory)
-                logger.debug(f"Cleaned up temporary directory: {directory}")
-        except Exception as e:
-            logger.warning(f"Failed to clean up temporary directory {directory}: {e}")
-    
     def validate_config(self) -> None:
         """Validate MongoDB-specific configuration.
         
@@ -4,24 +4,48 @@ dbVault CLI - Main entry point
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
-
-from .config.config_manager import ConfigManager
-from .database.factory import DatabaseFactory
-from .storage.factory import StorageFactory
-from .backup.backup_manager import BackupManager
-from .restore.restore_manager import RestoreManager
+
+from .config.config_manager import ConfigManager, get_config
 from .utils.logging import setup_logging, get_logger
+from .utils.size import format_size
+
+# Managers, factories and rich's table machinery are imported inside
+# the commands that need them — each CLI invocation runs one command,
+# so eager imports here only slow down startup (and --help).
 
-console = Console()
 logger = get_logger(__name__)
 
 
+def _backup_size(backup: dict) -> str:
+    """Render a backup's size for display.
+
+    Storage listings carry raw size_bytes only; the pretty string is
+    built here, at display time.
+    """
+    if 'size_bytes' in backup:
+        return format_size(backup['size_bytes'])
+    return backup.get('size', 'Unknown')
+
+
+@lru_cache(maxsize=None)
+def _console():
+    """Get the shared rich console, constructed on first print.
+
+    When stdout is piped, highlighting and markup parsing are switched
+    off: each costs a regex pass per print and buys nothing without a
+    terminal to render the styles.
+    """
+    from rich.console import Console
+    if not sys.stdout.isatty():
+        return Console(highlight=False, markup=False)
+    return Console()
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
@@ -44,15 +68,15 @@ def init(output: str):
         
         if config_path.exists():
             if not click.confirm(f"Configuration file '{output}' already exists. Overwrite?"):
-                console.print("❌ Configuration initialization cancelled.", style="yellow")
+                _console().print("❌ Configuration initialization cancelled.", style="yellow")
                 return
         
         config_manager.create_default_config(config_path)
-        console.print(f"✅ Configuration file created: {output}", style="green")
-        console.print(f"📝 Please edit {output} with your database and storage settings.", style="blue")
+        _console().print(f"✅ Configuration file created: {output}", style="green")
+        _console().print(f"📝 Please edit {output} with your database and storage settings.", style="blue")
         
     except Exception as e:
-        console.print(f"❌ Error creating configuration: {e}", style="red")
+        _console().print(f"❌ Error creating configuration: {e}", style="red")
         sys.exit(1)
 
 
@@ -64,28 +88,86 @@ def init(output: str):
               help='Storage backend to test (only used when --type is storage or all)')
 def test(config: str, type: str, storage: Optional[str]):
     """Test database and/or storage connections."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from .database.factory import DatabaseFactory
+    from .storage.factory import StorageFactory
+
     try:
-        config_manager = ConfigManager()
-        config_data = config_manager.load_config(config)
-        
-        success = True
-        
-        if type in ['database', 'all']:
-            console.print("🔍 Testing database connection...", style="blue")
+        config_data = get_config(config)
+
+        # Each check returns (ok, [(message, style), ...]); buffering
+        # the lines lets the checks run concurrently without their
+        # output interleaving.
+        def check_database():
+            lines = [("🔍 Testing database connection...", "blue")]
             try:
                 db_handler = DatabaseFactory.create_handler(config_data['database'])
                 if db_handler.test_connection():
-                    console.print("✅ Database connection successful!", style="green")
-                else:
-                    console.print("❌ Database connection failed!", style="red")
-                    success = False
+                    lines.append(("✅ Database connection successful!", "green"))
+                    return True, lines
+                lines.append(("❌ Database connection failed!", "red"))
             except Exception as e:
-                console.print(f"❌ Database connection failed: {e}", style="red")
-                success = False
-        
+                lines.append((f"❌ Database connection failed: {e}", "red"))
+            return False, lines
+
+        def check_local_storage():
+            lines = [("🔍 Testing local storage...", "blue")]
+            try:
+                if 'storage' not in config_data or 'local' not in config_data['storage']:
+                    lines.append(("❌ No local storage configuration found", "red"))
+                    return False, lines
+
+                local_handler = StorageFactory.create_handler('local', config_data['storage'])
+                backup_path = Path(local_handler.base_path)
+                backup_path.mkdir(parents=True, exist_ok=True)
+
+                lines.append(("✅ Local storage accessible!", "green"))
+                lines.append((f"📁 Backup directory: {backup_path}", "cyan"))
+
+                backups = local_handler.list_backups()
+                lines.append((f"� Found {len(backups)} backup(s) in local storage", "blue"))
+                return True, lines
+
+            except Exception as e:
+                lines.append((f"❌ Local storage test failed: {e}", "red"))
+                return False, lines
+
+        def check_s3_storage():
+            lines = [("🔍 Testing S3 storage...", "blue")]
+            try:
+                if 'storage' not in config_data or 'aws' not in config_data['storage']:
+                    lines.append(("❌ No AWS S3 configuration found in config file", "red"))
+                    return False, lines
+
+                s3_handler = StorageFactory.create_handler('s3', config_data['storage'])
+
+                lines.append(("📡 Checking bucket access...", "blue"))
+                backups = s3_handler.list_backups()
+
+                lines.append(("✅ S3 connection successful!", "green"))
+                bucket_name = config_data['storage']['aws']['bucket']
+                lines.append((f"🪣 Bucket: {bucket_name}", "cyan"))
+                lines.append((f"📋 Found {len(backups)} backup(s) in S3", "blue"))
+
+                if backups:
+                    lines.append(("📋 Recent backups:", "blue"))
+                    for backup in backups[:3]:
+                        lines.append((f"  • {backup['name']} ({_backup_size(backup)})", "dim"))
+                return True, lines
+
+            except Exception as e:
+                lines.append((f"❌ S3 connection test failed: {e}", "red"))
+                return False, lines
+
+        checks = []
+
+        if type in ['database', 'all']:
+            checks.append(check_database)
+
         if type in ['storage', 'all']:
             storage_backends = []
-            
+
             if storage == 'all' or storage is None:
                 if 'storage' in config_data:
                     if 'local' in config_data['storage']:
@@ -93,67 +175,40 @@ def test(config: str, type: str, storage: Optional[str]):
                     if 'aws' in config_data['storage']:
                         storage_backends.append('s3')
             else:
-                storage_type = storage if storage != 'aws' else 's3'
-                storage_backends.append(storage_type)
-            
+                storage_backends.append(storage if storage != 'aws' else 's3')
+
             for backend in storage_backends:
                 if backend == 'local':
-                    console.print("🔍 Testing local storage...", style="blue")
-                    try:
-                        if 'storage' not in config_data or 'local' not in config_data['storage']:
-                            console.print("❌ No local storage configuration found", style="red")
-                            success = False
-                            continue
-                        
-                        local_handler = StorageFactory.create_handler('local', config_data['storage'])
-                        backup_path = Path(local_handler.base_path)
-                        backup_path.mkdir(parents=True, exist_ok=True)
-                        
-                        console.print("✅ Local storage accessible!", style="green")
-                        console.print(f"📁 Backup directory: {backup_path}", style="cyan")
-                        
-                        backups = local_handler.list_backups()
-                        console.print(f"� Found {len(backups)} backup(s) in local storage", style="blue")
-                        
-                    except Exception as e:
-                        console.print(f"❌ Local storage test failed: {e}", style="red")
-                        success = False
-                
+                    checks.append(check_local_storage)
                 elif backend == 's3':
-                    console.print("🔍 Testing S3 storage...", style="blue")
-                    try:
-                        if 'storage' not in config_data or 'aws' not in config_data['storage']:
-                            console.print("❌ No AWS S3 configuration found in config file", style="red")
-                            success = False
-                            continue
-                        
-                        s3_handler = StorageFactory.create_handler('s3', config_data['storage'])
-                        
-                        console.print("📡 Checking bucket access...", style="blue")
-                        backups = s3_handler.list_backups()
-                        
-                        console.print("✅ S3 connection successful!", style="green")
-                        bucket_name = config_data['storage']['aws']['bucket']
-                        console.print(f"🪣 Bucket: {bucket_name}", style="cyan")
-                        console.print(f"📋 Found {len(backups)} backup(s) in S3", style="blue")
-                        
-                        if backups:
-                            console.print("📋 Recent backups:", style="blue")
-                            for backup in backups[:3]:
-                                console.print(f"  • {backup['name']} ({backup.get('size', 'Unknown')})", style="dim")
-                        
-                    except Exception as e:
-                        console.print(f"❌ S3 connection test failed: {e}", style="red")
-                        success = False
-        
+                    checks.append(check_s3_storage)
+
+        success = True
+
+        if len(checks) <= 1:
+            results = [check() for check in checks]
+        else:
+            # The checks are independent I/O against different services
+            # (database dial, disk stat, S3 listing), so overall latency
+            # becomes the slowest check instead of the sum. Printed in
+            # arrival order, one block per check.
+            with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+                futures = [pool.submit(check) for check in checks]
+                results = [future.result() for future in as_completed(futures)]
+
+        for ok, lines in results:
+            success = success and ok
+            for message, style in lines:
+                _console().print(message, style=style)
+
         if success:
-            console.print("🎉 All tests passed!", style="bold green")
+            _console().print("🎉 All tests passed!", style="bold green")
         else:
-            console.print("❌ Some tests failed!", style="bold red")
+            _console().print("❌ Some tests failed!", style="bold red")
             sys.exit(1)
             
     except Exception as e:
-        console.print(f"❌ Error during testing: {e}", style="red")
+        _console().print(f"❌ Error during testing: {e}", style="red")
         logger.error(f"Test failed: {e}", exc_info=True)
         sys.exit(1)
 
@@ -164,28 +219,36 @@ def test(config: str, type: str, storage: Optional[str]):
               help='Storage backend (overrides config default)')
 def backup(config: str, storage: Optional[str]):
     """Create a database backup."""
+    from .backup.backup_manager import BackupManager
+    from .database.factory import DatabaseFactory
+    from .storage.factory import StorageFactory
+
     try:
-        config_manager = ConfigManager()
-        config_data = config_manager.load_config(config)
+        config_data = get_config(config)
         
         storage_type = storage or config_data.get('backup', {}).get('default_storage', 'local')
         if storage_type == 'aws':
             storage_type = 's3' 
             
-        console.print(f"🚀 Starting backup to {storage_type} storage...", style="blue")
+        _console().print(f"🚀 Starting backup to {storage_type} storage...", style="blue")
         
         db_handler = DatabaseFactory.create_handler(config_data['database'])
         storage_handler = StorageFactory.create_handler(storage_type, config_data['storage'])
         
-        backup_manager = BackupManager(db_handler, storage_handler)
+        backup_manager = BackupManager(
+            db_handler, storage_handler,
+            estimated_compression_ratio=config_data.get('backup', {}).get('estimated_compression_ratio')
+        )
         backup_file = backup_manager.create_backup(
-            compress=config_data.get('backup', {}).get('compression', True)
+            compress=config_data.get('backup', {}).get('compression', True),
+            codec=config_data.get('backup', {}).get('compression_codec', 'gzip'),
+            level=config_data.get('backup', {}).get('compression_level', 3)
         )
         
-        console.print(f"✅ Backup completed: {backup_file}", style="green")
+        _console().print(f"✅ Backup completed: {backup_file}", style="green")
         
     except Exception as e:
-        console.print(f"❌ Backup failed: {e}", style="red")
+        _console().print(f"❌ Backup failed: {e}", style="red")
         logger.error(f"Backup failed: {e}", exc_info=True)
         sys.exit(1)
 
@@ -198,10 +261,14 @@ def backup(config: str, storage: Optional[str]):
 def restore(backup: str, config: str, storage: Optional[str]):
     """Restore database from backup."""
     import tempfile
-    
+    from contextlib import ExitStack
+
+    from .database.factory import DatabaseFactory
+    from .restore.restore_manager import RestoreManager
+    from .storage.factory import StorageFactory
+
     try:
-        config_manager = ConfigManager()
-        config_data = config_manager.load_config(config)
+        config_data = get_config(config)
         
         storage_type = storage
         if not storage_type:
@@ -213,44 +280,54 @@ def restore(backup: str, config: str, storage: Optional[str]):
         if storage_type == 'aws':
             storage_type = 's3' 
         
-        console.print(f"🔄 Starting restore from {backup} ({storage_type} storage)...", style="blue")
+        _console().print(f"🔄 Starting restore from {backup} ({storage_type} storage)...", style="blue")
         
         db_handler = DatabaseFactory.create_handler(config_data['database'])
         
-        local_backup_file = backup
-        temp_file = None
-        
-        if storage_type == 's3':
-            console.print("📥 Downloading backup from S3...", style="blue")
-            s3_handler = StorageFactory.create_handler('s3', config_data['storage'])
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.backup') as temp:
-                temp_file = temp.name
-            
-            backup_name = backup
-            if backup.startswith('s3://'):
-                backup_name = backup.split('/')[-1]
-            
-            s3_handler.download_backup(backup_name, temp_file)
-            local_backup_file = temp_file
-            console.print(f"📥 Downloaded to temporary file", style="blue")
-        
         restore_manager = RestoreManager(db_handler)
-        restore_manager.restore_backup(local_backup_file)
-        
-        console.print("✅ Restore completed successfully!", style="green")
-        
+
+        # The stack owns any staged download: the open temp file is
+        # unlinked on exit from every path, so no manual exists/unlink
+        # bookkeeping and nothing leaks on errors.
+        with ExitStack() as stack:
+            local_backup_file = backup
+
+            if storage_type == 's3':
+                s3_handler = StorageFactory.create_handler('s3', config_data['storage'])
+
+                backup_name = backup
+                if backup.startswith('s3://'):
+                    backup_name = backup.split('/')[-1]
+
+                # Stream the object straight through decompression into
+                # the restore tool when the handler supports it;
+                # downloading first is the fallback, not the default.
+                try:
+                    _console().print("📥 Streaming backup from S3...", style="blue")
+                    with s3_handler.open_backup_stream(backup_name) as body:
+                        restore_manager.restore_backup_from_stream(body, backup_name)
+
+                    _console().print("✅ Restore completed successfully!", style="green")
+                    return
+                except NotImplementedError:
+                    logger.debug("Streaming restore not supported for this database, "
+                                 "downloading backup first")
+
+                _console().print("📥 Downloading backup from S3...", style="blue")
+
+                temp = stack.enter_context(tempfile.NamedTemporaryFile(suffix='.backup'))
+                s3_handler.download_backup(backup_name, temp.name)
+                local_backup_file = temp.name
+                _console().print(f"📥 Downloaded to temporary file", style="blue")
+
+            restore_manager.restore_backup(local_backup_file)
+
+        _console().print("✅ Restore completed successfully!", style="green")
+
     except Exception as e:
-        console.print(f"❌ Restore failed: {e}", style="red")
+        _console().print(f"❌ Restore failed: {e}", style="red")
         logger.error(f"Restore failed: {e}", exc_info=True)
         sys.exit(1)
-    finally:
-        if temp_file and Path(temp_file).exists():
-            try:
-                Path(temp_file).unlink()
-                logger.debug(f"Cleaned up temporary file: {temp_file}")
-            except Exception as e:
-                logger.warning(f"Failed to clean up temporary file {temp_file}: {e}")
 
 
 @cli.command()
@@ -259,19 +336,22 @@ def restore(backup: str, config: str, storage: Optional[str]):
 @click.option('--config', '-c', help='Configuration file path (required for S3)')
 def list_backups(storage: str, config: Optional[str]):
     """List available backups."""
+    from rich.table import Table
+
+    from .storage.factory import StorageFactory
+
     try:
         storage_type = storage
         if storage_type == 'aws':
             storage_type = 's3'
             
         if storage_type == 's3' and not config:
-            console.print("❌ Configuration file required for S3 storage", style="red")
+            _console().print("❌ Configuration file required for S3 storage", style="red")
             sys.exit(1)
             
         config_data = None
         if config:
-            config_manager = ConfigManager()
-            config_data = config_manager.load_config(config)
+            config_data = get_config(config)
         
         if storage_type == 'local':
             if config_data:
@@ -284,25 +364,30 @@ def list_backups(storage: str, config: Optional[str]):
         backups = storage_handler.list_backups()
         
         if not backups:
-            console.print("📁 No backups found.", style="yellow")
+            _console().print("📁 No backups found.", style="yellow")
             return
-            
+
+        rows = [(b['name'], _backup_size(b), b.get('modified', 'Unknown'))
+                for b in backups]
+
+        # Piped output skips rich entirely: no column measuring or
+        # styling per row, and downstream tools get clean TSV.
+        if not sys.stdout.isatty():
+            sys.stdout.write('\n'.join('\t'.join(row) for row in rows) + '\n')
+            return
+
         table = Table(title=f"Available Backups ({storage_type.upper()})")
         table.add_column("Filename", style="cyan")
         table.add_column("Size", style="magenta")
         table.add_column("Modified", style="green")
-        
-        for backup_info in backups:
-            table.add_row(
-                backup_info['name'],
-                backup_info.get('size', 'Unknown'),
-                backup_info.get('modified', 'Unknown')
-            )
-            
-        console.print(table)
+
+        for row in rows:
+            table.add_row(*row)
+
+        _console().print(table)
         
     except Exception as e:
-        console.print(f"❌ Error listing backups: {e}", style="red")
+        _console().print(f"❌ Error listing backups: {e}", style="red")
         sys.exit(1)
 
 
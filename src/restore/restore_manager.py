@@ -2,17 +2,35 @@
 Restore manager - orchestrates restore operations
 """
 
+import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import List, Union
 
 from ..database.base import DatabaseHandler
-from ..utils.compression import decompress_file
+from ..utils.compression import decompress_file, open_decompressor, open_decompressor_stream
 from ..utils.logging import get_logger, BackupLogger, log_backup_metrics
+from ..utils.size import format_size
 
 logger = get_logger(__name__)
 
+#: Extensions that mark a backup as compressed, precomputed once
+#: instead of rebuilding the sets on every probe.
+_COMPRESSED_EXTS = frozenset({'.gz', '.tgz', '.bz2', '.xz', '.zst'})
+_COMPOUND_EXTS = frozenset({'.tar.gz', '.sql.gz'})
+
+#: Extensions that are definitively uncompressed dumps; restores of
+#: these skip the header sniff (and its open/read/close) entirely.
+_RAW_EXTS = frozenset({'.sql', '.dump', '.bson'})
+
+#: Leading bytes of supported compressed formats (xz, zstd, bzip2,
+#: gzip); bytes.startswith takes the whole tuple in one C-level call.
+_MAGIC_PREFIXES = (b'\xfd7zXZ\x00', b'\x28\xb5\x2f\xfd', b'BZh', b'\x1f\x8b')
+
 
 class RestoreManager:
     """Manages restore operations for databases."""
@@ -39,7 +57,7 @@ class RestoreManager:
             FileNotFoundError: If backup file doesn't exist
             Exception: If restore operation fails
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter_ns()
         backup_path = Path(backup_file)
         
         if not backup_path.exists():
@@ -50,30 +68,46 @@ class RestoreManager:
             f"{self.db_handler.get_database_type()}://{self.db_handler.host}/{self.db_handler.database}"
         )
         
-        decompressed_file = None
-        
         try:
-            if self._is_compressed_file(backup_file):
-                self.backup_logger.log_progress("Decompressing backup file")
-                
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.dump') as temp:
-                    decompressed_file = temp.name
-                
-                decompress_file(backup_file, decompressed_file)
-                restore_file = decompressed_file
+            # mongorestore consumes gzipped archives natively (--gzip),
+            # so only pre-decompress for handlers that need a raw dump.
+            # An unambiguous raw-dump suffix settles the question from
+            # the path alone, without opening the file.
+            if backup_path.suffix.lower() in _RAW_EXTS:
+                needs_decompression = False
             else:
-                restore_file = backup_file
-            
+                needs_decompression = (self._is_compressed_file(backup_file)
+                                       and self.db_handler.database_type != 'mongodb')
+
             self.backup_logger.log_progress("Testing database connection")
             if not self.db_handler.test_connection():
                 raise Exception("Database connection test failed before restore")
-            
+
             self.backup_logger.log_progress("Restoring database from backup")
-            
-            if not self.db_handler.restore_backup(restore_file):
+
+            # Any staged decompressed copy lives on the stack: the open
+            # temp file is unlinked on exit from every path, with no
+            # exists/unlink bookkeeping in a finally clause.
+            with ExitStack() as stack:
+                if needs_decompression:
+                    try:
+                        restored = self._restore_streaming(backup_file)
+                    except NotImplementedError:
+                        logger.debug(f"{type(self.db_handler).__name__} does not support "
+                                     f"streaming restores, staging decompressed copy")
+                        self.backup_logger.log_progress("Decompressing backup file")
+
+                        temp = stack.enter_context(
+                            tempfile.NamedTemporaryFile(suffix='.dump'))
+                        decompress_file(backup_file, temp.name)
+                        restored = self.db_handler.restore_backup(temp.name)
+                else:
+                    restored = self.db_handler.restore_backup(backup_file)
+
+            if not restored:
                 raise Exception("Database restore operation failed")
             
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_time) / 1e9
             backup_size = backup_path.stat().st_size
             
             log_backup_metrics(
@@ -91,14 +125,71 @@ class RestoreManager:
         except Exception as e:
             self.backup_logger.log_error(str(e), e)
             return False
-        finally:
-            if decompressed_file and Path(decompressed_file).exists():
-                try:
-                    Path(decompressed_file).unlink()
-                    logger.debug(f"Cleaned up temporary file: {decompressed_file}")
-                except Exception as e:
-                    logger.warning(f"Failed to clean up temporary file: {e}")
-    
+
+    def restore_backup_from_stream(self, source, backup_name: str) -> bool:
+        """Restore directly from a readable backup stream.
+
+        Used for remote backups: the bytes are decompressed as they
+        arrive (codec picked from the backup name, since the stream
+        cannot be rewound) and piped into the handler's streaming
+        restore, so transfer, decompression and database apply overlap
+        instead of running one after another.
+
+        Args:
+            source: Readable binary file object with the backup bytes
+            backup_name: Backup file name, used to pick the codec
+
+        Returns:
+            True if restore was successful, False otherwise
+
+        Raises:
+            NotImplementedError: If the handler cannot restore from a stream
+        """
+        self.backup_logger.start_operation(
+            "restore",
+            f"{self.db_handler.get_database_type()}://{self.db_handler.host}/{self.db_handler.database}"
+        )
+
+        try:
+            self.backup_logger.log_progress("Testing database connection")
+            if not self.db_handler.test_connection():
+                raise Exception("Database connection test failed before restore")
+
+            self.backup_logger.log_progress("Restoring database from remote stream")
+
+            with open_decompressor_stream(source, backup_name) as src:
+                if not self.db_handler.restore_backup_stream(src):
+                    raise Exception("Database restore operation failed")
+
+            self.backup_logger.log_success(f"Database restored from stream: {backup_name}")
+            return True
+
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            self.backup_logger.log_error(str(e), e)
+            return False
+
+    def _restore_streaming(self, backup_file: str) -> bool:
+        """Restore by decompressing straight into the restore tool.
+
+        The decompressor and the restore tool run as a pipeline, so the
+        decompressed dump never lands on disk and gunzip CPU overlaps
+        with the database apply.
+
+        Args:
+            backup_file: Path to the compressed backup file
+
+        Returns:
+            True if restore was successful, False otherwise
+
+        Raises:
+            NotImplementedError: If the handler cannot restore from a stream
+        """
+        self.backup_logger.log_progress("Streaming decompressed backup into restore tool")
+        with open_decompressor(backup_file) as src:
+            return self.db_handler.restore_backup_stream(src)
+
     def validate_backup_file(self, backup_file: str) -> dict:
         """Validate a backup file and return information about it.
         
@@ -126,18 +217,27 @@ class RestoreManager:
             
             stat = backup_path.stat()
             result['size'] = stat.st_size
-            result['size_formatted'] = self._format_size(stat.st_size)
+            result['size_formatted'] = format_size(stat.st_size)
             
             if stat.st_size == 0:
                 result['errors'].append("Backup file is empty")
                 return result
-            
-            result['compressed'] = self._is_compressed_file(backup_file)
-            
-            result['database_type'] = self._identify_database_type(backup_file)
-            
+
+            # One 4 KiB read serves every probe below; the helpers each
+            # re-opened the file for a few header bytes otherwise.
+            try:
+                with open(backup_file, 'rb') as f:
+                    header = f.read(4096)
+            except OSError:
+                header = b''
+
+            result['compressed'] = self._is_compressed_file(backup_file, header=header)
+
+            result['database_type'] = self._identify_database_type(backup_file, header=header)
+
             if result['database_type']:
-                db_validation = self._validate_database_backup(backup_file, result['database_type'])
+                db_validation = self._validate_database_backup(backup_file, result['database_type'],
+                                                               header=header)
                 result['errors'].extend(db_validation.get('errors', []))
                 if not db_validation.get('valid', False):
                     return result
@@ -150,129 +250,133 @@ class RestoreManager:
         
         return result
     
-    def _is_compressed_file(self, file_path: str) -> bool:
+    def validate_backup_files(self, backup_files: List[str]) -> List[dict]:
+        """Validate several backup files concurrently.
+
+        Each validation is dominated by a stat and a 4 KiB header read,
+        both of which release the GIL, so a thread pool overlaps the
+        per-file I/O instead of serializing it.
+
+        Args:
+            backup_files: Paths of the backup files to validate
+
+        Returns:
+            Validation result dictionaries, in input order
+        """
+        if not backup_files:
+            return []
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(backup_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.validate_backup_file, backup_files))
+
+    def _is_compressed_file(self, file_path: str, header: bytes = None) -> bool:
         """Check if a file is compressed.
-        
+
         Args:
             file_path: Path to the file
-            
+            header: Leading bytes of the file, if already read
+
         Returns:
             True if file appears to be compressed
         """
         path = Path(file_path)
-        
-        compressed_extensions = {'.gz', '.tar.gz', '.tgz', '.bz2', '.xz'}
-        if path.suffix.lower() in compressed_extensions:
+
+        if path.suffix.lower() in _COMPRESSED_EXTS:
             return True
-        
-        if len(path.suffixes) >= 2:
-            compound_suffix = ''.join(path.suffixes[-2:]).lower()
-            if compound_suffix in {'.tar.gz', '.sql.gz'}:
-                return True
-        
-        try:
-            with open(file_path, 'rb') as f:
-                header = f.read(10)
-                if header.startswith(b'\x1f\x8b'):
-                    return True
-                if header.startswith(b'BZ'):
-                    return True
-        except Exception:
-            pass
-        
-        return False
+
+        suffixes = path.suffixes
+        if len(suffixes) >= 2 and ''.join(suffixes[-2:]).lower() in _COMPOUND_EXTS:
+            return True
+
+        if header is None:
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    header = os.read(fd, 8)
+                finally:
+                    os.close(fd)
+            except OSError:
+                return False
+
+        return header.startswith(_MAGIC_PREFIXES)
     
-    def _identify_database_type(self, backup_file: str) -> str:
+    def _identify_database_type(self, backup_file: str, header: bytes = None) -> str:
         """Try to identify the database type from the backup file.
-        
+
         Args:
             backup_file: Path to the backup file
-            
+            header: Leading bytes of the file, if already read
+
         Returns:
             Database type string or None if unable to identify
         """
         path = Path(backup_file)
         filename = path.name.lower()
-        
+
         if 'postgres' in filename or 'pg_' in filename:
             return 'postgresql'
         elif 'mongo' in filename:
             return 'mongodb'
-        
-        if not self._is_compressed_file(backup_file):
+
+        if not self._is_compressed_file(backup_file, header=header):
             try:
-                with open(backup_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read(1024)
-                    if 'PostgreSQL' in content or 'pg_dump' in content:
-                        return 'postgresql'
-                    elif 'mongodump' in content or 'db.collection' in content:
-                        return 'mongodb'
+                if header is None:
+                    with open(backup_file, 'rb') as f:
+                        header = f.read(1024)
+                # The markers are ASCII, so search the raw bytes —
+                # bytes.__contains__ runs in C without the UTF-8 decode
+                # pass a text-mode read would pay.
+                head = header[:1024]
+                if b'PostgreSQL' in head or b'pg_dump' in head:
+                    return 'postgresql'
+                elif b'mongodump' in head or b'db.collection' in head:
+                    return 'mongodb'
             except Exception:
                 pass
-        
+
         return None
     
-    def _validate_database_backup(self, backup_file: str, db_type: str) -> dict:
+    def _validate_database_backup(self, backup_file: str, db_type: str,
+                                  header: bytes = None) -> dict:
         """Validate backup file for specific database type.
-        
+
         Args:
             backup_file: Path to backup file
             db_type: Database type ('postgresql', 'mongodb')
-            
+            header: Leading bytes of the file, if already read
+
         Returns:
             Dictionary with validation results
         """
         result = {'valid': True, 'errors': []}
-        
+
         try:
             if db_type == 'postgresql':
-                if self._is_compressed_file(backup_file):
+                if self._is_compressed_file(backup_file, header=header):
                     pass
                 else:
-                    with open(backup_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        first_line = f.readline()
-                        if not ('PostgreSQL' in first_line or 'pg_dump' in first_line or first_line.startswith('--')):
-                            result['errors'].append("File does not appear to be a PostgreSQL dump")
-                            result['valid'] = False
-            
+                    if header is None:
+                        with open(backup_file, 'rb') as f:
+                            header = f.read(1024)
+                    first_line, _, _ = header.decode('utf-8', errors='ignore').partition('\n')
+                    if not ('PostgreSQL' in first_line or 'pg_dump' in first_line or first_line.startswith('--')):
+                        result['errors'].append("File does not appear to be a PostgreSQL dump")
+                        result['valid'] = False
+
             elif db_type == 'mongodb':
-                if backup_file.endswith('.tar.gz') or backup_file.endswith('.tgz'):
+                if self._is_compressed_file(backup_file, header=header):
                     pass
                 else:
-                    result['errors'].append("MongoDB backup should be a .tar.gz archive")
+                    result['errors'].append("MongoDB backup should be a gzip-compressed archive")
                     result['valid'] = False
-        
+
         except Exception as e:
             result['errors'].append(f"Error validating {db_type} backup: {e}")
             result['valid'] = False
-        
+
         return result
     
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format.
-        
-        Args:
-            size_bytes: Size in bytes
-            
-        Returns:
-            Formatted size string
-        """
-        if size_bytes == 0:
-            return "0 B"
-        
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        unit_index = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-        
-        if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.1f} {units[unit_index]}"
-    
     def __str__(self) -> str:
         """String representation of restore manager."""
         return f"RestoreManager(db={self.db_handler})"
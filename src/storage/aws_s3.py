@@ -3,21 +3,77 @@ AWS S3 storage handler
 """
 
 import os
+import time
+from array import array
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotocoreConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from .base import BackupEntry, StorageHandler
 from ..utils.logging import get_logger
+from ..utils.size import format_size
+
+# numpy is optional: when present the columnar listing returns real
+# ndarrays (argsort and friends in C); otherwise compact stdlib arrays.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
 
 logger = get_logger(__name__)
 
+#: How long a full listing stays fresh; repeated CLI calls inside this
+#: window reuse it instead of re-paginating the whole prefix.
+_LIST_CACHE_TTL = 30.0
+
+
+@lru_cache(maxsize=8)
+def _cached_s3_client(region: str, access_key: Optional[str], secret_key: Optional[str]):
+    """Create (or reuse) a boto3 S3 client for the given credentials.
+
+    Clients hold a keep-alive HTTPS connection pool, so reusing them
+    across handler instances avoids repeated TLS handshakes and
+    credential resolution.
+
+    Args:
+        region: AWS region name
+        access_key: AWS access key ID (optional)
+        secret_key: AWS secret access key (optional)
 
-class AWSS3Storage:
+    Returns:
+        Boto3 S3 client
+    """
+    # Pool sized for the transfer manager's parallel range requests;
+    # keep-alive avoids TCP slow-start per part and adaptive retries
+    # back off under throttling instead of hammering.
+    client_config = BotocoreConfig(
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        retries={'max_attempts': 5, 'mode': 'adaptive'}
+    )
+
+    if access_key and secret_key:
+        return boto3.client(
+            's3',
+            region_name=region,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            config=client_config
+        )
+    return boto3.client('s3', region_name=region, config=client_config)
+
+
+class AWSS3Storage(StorageHandler):
     """Handler for AWS S3 storage."""
-    
+
+    name = 's3'
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize AWS S3 storage handler.
         
@@ -27,7 +83,24 @@ class AWSS3Storage:
         self.config = config
         self.bucket_name = config['bucket']
         self.region = config.get('region', 'us-west-2')
-        
+
+        # 64 MiB parts: large enough that per-part request overhead is
+        # noise on multi-GB backups, and a multi-GB object stays well
+        # under the 10k-part multipart limit.
+        # preferred_transfer_client='auto' routes transfers through the
+        # C-based CRT S3 client whenever awscrt is installed — parallel
+        # part reads without the GIL — and falls back to the classic
+        # threaded transfer manager otherwise.
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=config.get('multipart_chunksize', 64 * 1024 * 1024),
+            max_concurrency=config.get('max_concurrency', 16),
+            use_threads=True,
+            preferred_transfer_client='auto'
+        )
+
+        self._list_cache = (0.0, None)
+
         self.s3_client = self._create_s3_client(config)
         
         self._verify_bucket_access()
@@ -47,19 +120,12 @@ class AWSS3Storage:
             NoCredentialsError: If AWS credentials are not found
         """
         try:
-            aws_access_key = config.get('access_key')
-            aws_secret_key = config.get('secret_key')
-            
-            if aws_access_key and aws_secret_key:
-                return boto3.client(
-                    's3',
-                    region_name=self.region,
-                    aws_access_key_id=aws_access_key,
-                    aws_secret_access_key=aws_secret_key
-                )
-            else:
-                return boto3.client('s3', region_name=self.region)
-                
+            return _cached_s3_client(
+                self.region,
+                config.get('access_key'),
+                config.get('secret_key')
+            )
+
         except NoCredentialsError:
             logger.error("AWS credentials not found. Please configure AWS credentials.")
             raise
@@ -86,16 +152,19 @@ class AWSS3Storage:
                 logger.error(f"S3 bucket access error: {e}")
             raise
     
-    def store_backup(self, source_file: str, backup_name: str) -> str:
+    def store_backup(self, source_file: str, backup_name: str, sha256: str = None) -> Dict[str, Any]:
         """Store a backup file in S3.
-        
+
         Args:
             source_file: Path to the source backup file
             backup_name: Name for the stored backup file (S3 key)
-            
+            sha256: Optional SHA-256 hex digest computed while the backup
+                was written, stored as object metadata
+
         Returns:
-            S3 URI of the stored backup file
-            
+            Dictionary with 'id' (S3 URI of the stored backup) and
+            'size' (uploaded size in bytes)
+
         Raises:
             FileNotFoundError: If source file doesn't exist
             ClientError: If S3 operation fails
@@ -119,18 +188,27 @@ class AWSS3Storage:
                     'original-filename': source_path.name
                 }
             }
+
+            if sha256:
+                extra_args['Metadata']['sha256-checksum'] = sha256
             
-            self.s3_client.upload_file(
-                str(source_path),
-                self.bucket_name,
-                s3_key,
-                ExtraArgs=extra_args
-            )
+            # upload_fileobj on a pre-opened handle: upload_file would
+            # re-stat and re-open the file we just statted for the log.
+            with open(source_path, 'rb') as source:
+                self.s3_client.upload_fileobj(
+                    source,
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs=extra_args,
+                    Config=self.transfer_config
+                )
             
+            self.invalidate_cache()
+
             s3_uri = f"s3://{self.bucket_name}/{s3_key}"
             logger.info(f"Backup uploaded to S3: {s3_uri}")
-            return s3_uri
-            
+            return {'id': s3_uri, 'size': file_size}
+
         except ClientError as e:
             logger.error(f"Failed to upload backup to S3: {e}")
             raise
@@ -138,6 +216,41 @@ class AWSS3Storage:
             logger.error(f"Unexpected error uploading to S3: {e}")
             raise
     
+    def store_backups(self, backups: List[tuple]) -> Dict[str, Any]:
+        """Store several backups with overlapping uploads.
+
+        Uploads are network-bound, so a small thread pool runs them
+        concurrently; each upload still uses the multipart transfer
+        config internally.
+
+        Args:
+            backups: (source_file, backup_name) pairs to upload
+
+        Returns:
+            Mapping of backup name to its store_backup result, or
+            None for uploads that failed
+        """
+        if not backups:
+            return {}
+
+        results: Dict[str, Any] = {}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(backups))) as pool:
+            futures = {
+                pool.submit(self.store_backup, source_file, backup_name): backup_name
+                for source_file, backup_name in backups
+            }
+            for future, backup_name in futures.items():
+                try:
+                    results[backup_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to upload backup to S3: {backup_name}: {e}")
+                    results[backup_name] = None
+
+        return results
+
     def download_backup(self, backup_name: str, destination_file: str) -> str:
         """Download a backup file from S3.
         
@@ -171,19 +284,25 @@ class AWSS3Storage:
         destination_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
-            
+            # No head_object existence pre-check: download_file raises
+            # its own 404 for a missing key, so the extra round trip
+            # bought nothing.
+            #
+            # The transfer config splits the download into parallel
+            # range GETs; a single-stream GET tops out well below what
+            # the link can carry.
             self.s3_client.download_file(
                 self.bucket_name,
                 s3_key,
-                str(destination_path)
+                str(destination_path),
+                Config=self.transfer_config
             )
             
             logger.info(f"Backup downloaded from S3: {destination_path}")
             return str(destination_path)
             
         except ClientError as e:
-            if e.response['Error']['Code'] == '404':
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
                 raise FileNotFoundError(f"Backup not found in S3: {backup_name}")
             else:
                 logger.error(f"Failed to download backup from S3: {e}")
@@ -191,47 +310,107 @@ class AWSS3Storage:
         except Exception as e:
             logger.error(f"Unexpected error downloading from S3: {e}")
             raise
-    
-    def list_backups(self) -> List[Dict[str, Any]]:
-        """List all backup files in S3.
-        
+
+    def open_backup_stream(self, backup_name: str):
+        """Open a backup object as a readable stream.
+
+        The caller reads the object body as it arrives off the network,
+        so a restore can overlap the transfer with decompression and
+        apply instead of staging a full local download first.
+
+        Args:
+            backup_name: Name of the backup file (S3 key basename)
+
         Returns:
-            List of dictionaries containing backup file information
+            Readable binary file object over the object body
+
+        Raises:
+            FileNotFoundError: If the backup does not exist in S3
+            ClientError: If the S3 operation fails
         """
-        backups = []
-        prefix = "dbvault/backups/"
-        
+        s3_key = f"dbvault/backups/{backup_name}"
+
         try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(
-                Bucket=self.bucket_name,
-                Prefix=prefix
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+            logger.info(f"Streaming backup from S3: s3://{self.bucket_name}/{s3_key}")
+            return response['Body']
+
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"Backup not found in S3: {backup_name}")
+            logger.error(f"Failed to stream backup from S3: {e}")
+            raise
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached listing so the next list_backups re-fetches.
+
+        Called internally after any mutation; external callers that
+        write to the bucket behind this handler's back can use it too.
+        """
+        self._list_cache = (0.0, None)
+
+    def iter_backups(self):
+        """Iterate over backups in S3 without materializing the listing.
+
+        ListObjectsV2 pages are fetched lazily, so callers that stop
+        early only pay for the pages they consume. Unlike list_backups,
+        results arrive in key order rather than newest-first.
+
+        Yields:
+            BackupEntry records, one per object
+        """
+        prefix = "dbvault/backups/"
+
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        page_iterator = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={'PageSize': 1000}
+        )
+
+        # search() flattens the pages inside botocore, replacing the
+        # per-page Python loop; it yields None for pages with no
+        # Contents key.
+        for obj in page_iterator.search('Contents[]'):
+            if obj is None or obj['Key'] == prefix:
+                continue
+
+            backup_name = obj['Key'][len(prefix):]
+
+            # Slotted entries, no pretty 'size' string: formatting is
+            # display concern and cost, so callers render from
+            # size_bytes.
+            yield BackupEntry(
+                name=backup_name,
+                key=obj['Key'],
+                size_bytes=obj['Size'],
+                modified=obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S'),
+                modified_timestamp=obj['LastModified'].timestamp(),
+                s3_uri=f"s3://{self.bucket_name}/{obj['Key']}"
             )
-            
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        if obj['Key'] == prefix:
-                            continue
-                        
-                        backup_name = obj['Key'][len(prefix):]
-                        
-                        backup_info = {
-                            'name': backup_name,
-                            'key': obj['Key'],
-                            'size': self._format_size(obj['Size']),
-                            'size_bytes': obj['Size'],
-                            'modified': obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S'),
-                            'modified_timestamp': obj['LastModified'].timestamp(),
-                            's3_uri': f"s3://{self.bucket_name}/{obj['Key']}"
-                        }
-                        backups.append(backup_info)
-            
-            backups.sort(key=lambda x: x['modified_timestamp'], reverse=True)
-            
+
+    def list_backups(self) -> List[BackupEntry]:
+        """List all backup files in S3, newest first.
+
+        Results are cached briefly so back-to-back calls (e.g. a listing
+        followed by get_storage_info) issue one paginated LIST, not two;
+        store_backup and delete_backup invalidate the cache.
+
+        Returns:
+            List of BackupEntry records describing the backup files
+        """
+        cached_at, cached = self._list_cache
+        if cached is not None and time.monotonic() - cached_at < _LIST_CACHE_TTL:
+            return list(cached)
+
+        try:
+            backups = list(self.iter_backups())
+            backups.sort(key=lambda x: x.modified_timestamp, reverse=True)
+
+            self._list_cache = (time.monotonic(), backups)
             logger.info(f"Found {len(backups)} backup files in S3")
-            return backups
-            
+            return list(backups)
+
         except ClientError as e:
             logger.error(f"Failed to list S3 backups: {e}")
             return []
@@ -239,6 +418,38 @@ class AWSS3Storage:
             logger.error(f"Unexpected error listing S3 backups: {e}")
             return []
     
+    def list_backups_columnar(self) -> Dict[str, Any]:
+        """Columnar view of the listing for bulk sort and filter.
+
+        Retention policies that rank or threshold thousands of backups
+        work on whole columns (numpy argsort or typed-array scans)
+        instead of calling a Python key function per entry.
+
+        Returns:
+            Dictionary with parallel columns: 'name' (list of str),
+            'size_bytes' (int64 column) and 'timestamp' (float64
+            column); numpy arrays when numpy is installed, stdlib
+            typed arrays otherwise
+        """
+        backups = self.list_backups()
+        count = len(backups)
+
+        names = [backup.name for backup in backups]
+        sizes = (backup.size_bytes for backup in backups)
+        timestamps = (backup.modified_timestamp for backup in backups)
+
+        if _np is not None:
+            return {
+                'name': names,
+                'size_bytes': _np.fromiter(sizes, dtype=_np.int64, count=count),
+                'timestamp': _np.fromiter(timestamps, dtype=_np.float64, count=count)
+            }
+        return {
+            'name': names,
+            'size_bytes': array('q', sizes),
+            'timestamp': array('d', timestamps)
+        }
+
     def delete_backup(self, backup_name: str) -> bool:
         """Delete a backup file from S3.
         
@@ -252,6 +463,7 @@ class AWSS3Storage:
         
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            self.invalidate_cache()
             logger.info(f"Deleted backup from S3: {backup_name}")
             return True
             
@@ -262,6 +474,53 @@ class AWSS3Storage:
             logger.error(f"Unexpected error deleting from S3: {e}")
             return False
     
+    def delete_backups(self, backup_names: List[str]) -> Dict[str, bool]:
+        """Delete several backups with batched DeleteObjects calls.
+
+        S3 accepts up to 1000 keys per DeleteObjects request, so a
+        retention sweep over N backups costs ceil(N/1000) round trips
+        instead of N.
+
+        Args:
+            backup_names: Names of the backup files to delete
+
+        Returns:
+            Mapping of backup name to whether its deletion succeeded
+        """
+        prefix = "dbvault/backups/"
+        results: Dict[str, bool] = {}
+
+        try:
+            for start in range(0, len(backup_names), 1000):
+                chunk = backup_names[start:start + 1000]
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': prefix + name} for name in chunk],
+                        'Quiet': True
+                    }
+                )
+
+                for name in chunk:
+                    results[name] = True
+                for error in response.get('Errors', ()):
+                    failed = error['Key'][len(prefix):]
+                    logger.error(f"Failed to delete backup from S3: {failed}: "
+                                 f"{error.get('Message', error.get('Code'))}")
+                    results[failed] = False
+
+            if backup_names:
+                self.invalidate_cache()
+                logger.info(f"Deleted {sum(results.values())} of {len(backup_names)} "
+                            f"backups from S3")
+            return results
+
+        except ClientError as e:
+            logger.error(f"Failed to batch-delete backups from S3: {e}")
+            for name in backup_names:
+                results.setdefault(name, False)
+            return results
+
     def backup_exists(self, backup_name: str) -> bool:
         """Check if a backup file exists in S3.
         
@@ -308,46 +567,36 @@ class AWSS3Storage:
             logger.error(f"Failed to generate presigned URL: {e}")
             return None
     
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format.
-        
-        Args:
-            size_bytes: Size in bytes
-            
-        Returns:
-            Formatted size string
-        """
-        if size_bytes == 0:
-            return "0 B"
-        
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        unit_index = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-        
-        if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.1f} {units[unit_index]}"
-    
     def get_storage_info(self) -> Dict[str, Any]:
         """Get storage information and statistics.
-        
+
+        Sums sizes from a fresh cached listing when one exists;
+        otherwise streams the pages through iter_backups, accumulating
+        count and bytes without holding the whole listing in memory.
+
         Returns:
             Dictionary with storage information
         """
-        backups = self.list_backups()
-        total_backup_size = sum(backup['size_bytes'] for backup in backups)
-        
+        cached_at, cached = self._list_cache
+        if cached is not None and time.monotonic() - cached_at < _LIST_CACHE_TTL:
+            backup_count = len(cached)
+            total_backup_size = sum(backup.size_bytes for backup in cached)
+        else:
+            backup_count = 0
+            total_backup_size = 0
+            try:
+                for backup in self.iter_backups():
+                    backup_count += 1
+                    total_backup_size += backup.size_bytes
+            except ClientError as e:
+                logger.error(f"Failed to list S3 backups: {e}")
+
         return {
             'type': 's3',
             'bucket': self.bucket_name,
             'region': self.region,
-            'backup_count': len(backups),
-            'total_backup_size': self._format_size(total_backup_size),
+            'backup_count': backup_count,
+            'total_backup_size': format_size(total_backup_size),
             'total_backup_size_bytes': total_backup_size
         }
     
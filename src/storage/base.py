@@ -0,0 +1,137 @@
+"""
+Abstract base class for storage handlers
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class BackupEntry:
+    """A single backup in a storage listing.
+
+    Slotted fixed-layout records instead of per-entry dicts: a
+    fraction of the memory on large listings and attribute access
+    without per-key hashing. Dict-style access ([], get, in) is kept
+    so existing callers and test doubles that index by key still
+    work.
+    """
+
+    __slots__ = ('name', 'size_bytes', 'modified', 'modified_timestamp',
+                 'path', 'key', 's3_uri')
+
+    def __init__(self, name: str, size_bytes: int, modified: str,
+                 modified_timestamp: float, path: Optional[str] = None,
+                 key: Optional[str] = None, s3_uri: Optional[str] = None):
+        self.name = name
+        self.size_bytes = size_bytes
+        self.modified = modified
+        self.modified_timestamp = modified_timestamp
+        self.path = path
+        self.key = key
+        self.s3_uri = s3_uri
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def __contains__(self, field):
+        return field in self.__slots__ and getattr(self, field) is not None
+
+    def get(self, field, default=None):
+        """Dict-compatible lookup with a default."""
+        value = getattr(self, field, None)
+        return value if value is not None else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the entry as a plain dict (e.g. for JSON output)."""
+        return {field: getattr(self, field) for field in self.__slots__
+                if getattr(self, field) is not None}
+
+    def __repr__(self):
+        return f"BackupEntry(name={self.name!r}, size_bytes={self.size_bytes})"
+
+
+class StorageHandler(ABC):
+    """Abstract base class for storage handlers."""
+
+    name = 'unknown'
+
+    @abstractmethod
+    def store_backup(self, source_file: str, backup_name: str, sha256: str = None) -> Dict[str, Any]:
+        """Store a backup file.
+
+        Args:
+            source_file: Path to the source backup file
+            backup_name: Name for the stored backup file
+            sha256: Optional SHA-256 hex digest of the backup content
+
+        Returns:
+            Dictionary with 'id' (stored backup identifier) and
+            'size' (stored size in bytes)
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_backup(self, backup_name: str, destination_file: str) -> str:
+        """Retrieve a backup file.
+
+        Args:
+            backup_name: Name of the backup file to retrieve
+            destination_file: Path where to save the retrieved file
+
+        Returns:
+            Path to the retrieved backup file
+        """
+        pass
+
+    @abstractmethod
+    def list_backups(self) -> List[BackupEntry]:
+        """List all backup files in storage.
+
+        Returns:
+            List of BackupEntry records describing the backup files
+        """
+        pass
+
+    @abstractmethod
+    def delete_backup(self, backup_name: str) -> bool:
+        """Delete a backup file from storage.
+
+        Args:
+            backup_name: Name of the backup file to delete
+
+        Returns:
+            True if deletion was successful, False otherwise
+        """
+        pass
+
+    def delete_backups(self, backup_names: List[str]) -> Dict[str, bool]:
+        """Delete several backup files.
+
+        Handlers whose backend supports bulk deletion override this;
+        the default simply deletes one at a time.
+
+        Args:
+            backup_names: Names of the backup files to delete
+
+        Returns:
+            Mapping of backup name to whether its deletion succeeded
+        """
+        return {name: self.delete_backup(name) for name in backup_names}
+
+    @abstractmethod
+    def backup_exists(self, backup_name: str) -> bool:
+        """Check if a backup file exists in storage.
+
+        A single existence probe (stat or HEAD request) — O(1) instead
+        of listing and scanning all backups.
+
+        Args:
+            backup_name: Name of the backup file
+
+        Returns:
+            True if backup exists, False otherwise
+        """
+        pass
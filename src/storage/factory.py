@@ -2,25 +2,74 @@
 Storage factory for creating storage handlers
 """
 
-from typing import Dict, Any, Union
+import importlib
+from typing import Dict, Any
+from ..storage.base import StorageHandler
 from ..storage.local import LocalStorage
-from ..storage.aws_s3 import AWSS3Storage
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _freeze(value):
+    """Build a hashable, order-stable key from a config subtree.
+
+    Args:
+        value: Dictionary, list or scalar from a parsed config
+
+    Returns:
+        Hashable representation of the value
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class StorageFactory:
     """Factory for creating storage handler instances."""
     
+    # The S3 handler is registered as a "module:class" dotted path so
+    # boto3 (and its service models) only loads when an S3 handler is
+    # actually requested; resolved classes are cached back into the
+    # registry. Same scheme as DatabaseFactory.
     _storage_handlers = {
         'local': LocalStorage,
-        's3': AWSS3Storage,
-        'aws': AWSS3Storage,
+        's3': '.aws_s3:AWSS3Storage',
+        'aws': '.aws_s3:AWSS3Storage',
+    }
+
+    #: Which config section each storage type reads; types without an
+    #: entry use their own name as the section.
+    _config_sections = {
+        's3': 'aws',
     }
+
+    # S3 handlers verify bucket access at construction; reusing one
+    # instance per config skips that round trip on repeat commands.
+    _instances: Dict[Any, StorageHandler] = {}
     
     @classmethod
-    def create_handler(cls, storage_type: str, config: Dict[str, Any]) -> Union[LocalStorage, AWSS3Storage]:
+    def _resolve_handler(cls, storage_type: str) -> type:
+        """Resolve a registry entry to a handler class, importing lazily.
+
+        Args:
+            storage_type: Storage type identifier (must exist in the registry)
+
+        Returns:
+            Handler class
+        """
+        entry = cls._storage_handlers[storage_type]
+        if isinstance(entry, str):
+            module_path, class_name = entry.split(':')
+            module = importlib.import_module(module_path, package=__package__)
+            entry = getattr(module, class_name)
+            cls._storage_handlers[storage_type] = entry
+        return entry
+
+    @classmethod
+    def create_handler(cls, storage_type: str, config: Dict[str, Any]) -> StorageHandler:
         """Create a storage handler instance.
         
         Args:
@@ -41,17 +90,19 @@ class StorageFactory:
             available_types = list(cls._storage_handlers.keys())
             raise ValueError(f"Unsupported storage type: {storage_type}. Available: {available_types}")
         
-        handler_class = cls._storage_handlers[storage_type]
-        
-        if storage_type == 'local':
-            handler_config = config.get('local', config)
-        elif storage_type == 's3':
-            handler_config = config.get('aws', config)
-        else:
-            handler_config = config
-        
-        logger.info(f"Creating {storage_type} storage handler")
-        return handler_class(handler_config)
+        handler_class = cls._resolve_handler(storage_type)
+
+        section = cls._config_sections.get(storage_type, storage_type)
+        handler_config = config.get(section, config)
+
+        key = (handler_class, _freeze(handler_config))
+        handler = cls._instances.get(key)
+        if handler is None:
+            logger.info(f"Creating {storage_type} storage handler")
+            handler = handler_class(handler_config)
+            cls._instances[key] = handler
+
+        return handler
     
     @classmethod
     def get_available_types(cls) -> list:
@@ -8,14 +8,23 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
 
+from .base import BackupEntry, StorageHandler
 from ..utils.logging import get_logger
+from ..utils.size import format_size
 
 logger = get_logger(__name__)
 
 
-class LocalStorage:
+class LocalStorage(StorageHandler):
     """Handler for local filesystem storage."""
-    
+
+    name = 'local'
+
+    #: Suffixes and name fragments that mark backup files, hoisted to
+    #: class scope so directory scans don't rebuild them per entry.
+    _BACKUP_EXTS = ('.sql', '.gz', '.tar', '.tgz', '.bak', '.dump', '.zst')
+    _BACKUP_PATTERNS = ('backup', 'dump', 'export')
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize local storage handler.
         
@@ -24,20 +33,30 @@ class LocalStorage:
         """
         self.config = config
         self.base_path = Path(config['path']).expanduser().resolve()
-        
+
+        # Listing cache keyed on the directory's own mtime: adding or
+        # removing an entry bumps it, so one stat decides whether the
+        # walk can be skipped. cache_list=False opts out for
+        # filesystems with coarse mtime (e.g. FAT).
+        self._cache_list = config.get('cache_list', True)
+        self._cached_mtime = None
+        self._cached_list = None
+
         self.base_path.mkdir(parents=True, exist_ok=True)
         logger.info(f"Local storage initialized: {self.base_path}")
     
-    def store_backup(self, source_file: str, backup_name: str) -> str:
+    def store_backup(self, source_file: str, backup_name: str, sha256: str = None) -> Dict[str, Any]:
         """Store a backup file in local storage.
-        
+
         Args:
             source_file: Path to the source backup file
             backup_name: Name for the stored backup file
-            
+            sha256: Optional SHA-256 hex digest of the backup content
+
         Returns:
-            Path to the stored backup file
-            
+            Dictionary with 'id' (path to the stored backup file) and
+            'size' (stored size in bytes)
+
         Raises:
             FileNotFoundError: If source file doesn't exist
             OSError: If storage operation fails
@@ -50,13 +69,16 @@ class LocalStorage:
         
         try:
             shutil.copy2(source_path, destination_path)
-            
+
+            if sha256:
+                logger.debug(f"Backup checksum (sha256): {sha256}")
+
             file_size = destination_path.stat().st_size
             size_mb = file_size / (1024 * 1024)
-            
+
             logger.info(f"Backup stored locally: {destination_path} ({size_mb:.2f} MB)")
-            return str(destination_path)
-            
+            return {'id': str(destination_path), 'size': file_size}
+
         except Exception as e:
             logger.error(f"Failed to store backup locally: {e}")
             raise OSError(f"Local storage operation failed: {e}")
@@ -91,33 +113,50 @@ class LocalStorage:
             logger.error(f"Failed to retrieve backup from local storage: {e}")
             raise OSError(f"Local retrieval operation failed: {e}")
     
-    def list_backups(self) -> List[Dict[str, Any]]:
+    def list_backups(self) -> List[BackupEntry]:
         """List all backup files in local storage.
         
         Returns:
-            List of dictionaries containing backup file information
+            List of BackupEntry records describing the backup files
         """
         backups = []
-        
+
         try:
-            for file_path in self.base_path.iterdir():
-                if file_path.is_file() and self._is_backup_file(file_path):
-                    stat = file_path.stat()
-                    
-                    backup_info = {
-                        'name': file_path.name,
-                        'path': str(file_path),
-                        'size': self._format_size(stat.st_size),
-                        'size_bytes': stat.st_size,
-                        'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                        'modified_timestamp': stat.st_mtime
-                    }
-                    backups.append(backup_info)
-            
-            backups.sort(key=lambda x: x['modified_timestamp'], reverse=True)
-            
+            mtime = os.stat(self.base_path).st_mtime_ns if self._cache_list else None
+            if mtime is not None and mtime == self._cached_mtime:
+                return list(self._cached_list)
+
+            # scandir DirEntry objects carry type and stat info from the
+            # directory read itself, so each entry costs one syscall at
+            # most instead of the three iterdir+is_file+stat would make.
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if not self._is_backup_file(entry.name):
+                        continue
+
+                    stat = entry.stat()
+
+                    # Slotted entries, no pretty 'size' string: callers
+                    # that display sizes format from size_bytes at
+                    # render time.
+                    backups.append(BackupEntry(
+                        name=entry.name,
+                        path=entry.path,
+                        size_bytes=stat.st_size,
+                        modified=datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                        modified_timestamp=stat.st_mtime
+                    ))
+
+            backups.sort(key=lambda x: x.modified_timestamp, reverse=True)
+
+            if mtime is not None:
+                self._cached_mtime = mtime
+                self._cached_list = backups
+
             logger.info(f"Found {len(backups)} backup files in local storage")
-            return backups
+            return list(backups) if mtime is not None else backups
             
         except Exception as e:
             logger.error(f"Failed to list local backups: {e}")
@@ -187,54 +226,25 @@ class LocalStorage:
             logger.error(f"Failed to get disk space information: {e}")
             return {'total': 0, 'used': 0, 'free': 0}
     
-    def _is_backup_file(self, file_path: Path) -> bool:
-        """Check if a file appears to be a backup file.
-        
+    def _is_backup_file(self, name: str) -> bool:
+        """Check if a file name looks like a backup file.
+
         Args:
-            file_path: Path to the file
-            
+            name: File name (no directory component)
+
         Returns:
-            True if file appears to be a backup file
+            True if the name appears to belong to a backup file
         """
-        backup_extensions = {'.sql', '.gz', '.tar', '.tar.gz', '.tgz', '.bak', '.dump'}
-        
-        if file_path.suffix.lower() in backup_extensions:
+        name_lower = str(name).lower()
+
+        # endswith with a tuple is a single C-level check; the compound
+        # suffixes (.sql.gz, .tar.gz) are implied by plain .gz.
+        if name_lower.endswith(self._BACKUP_EXTS):
             return True
-        
-        if len(file_path.suffixes) >= 2:
-            compound_suffix = ''.join(file_path.suffixes[-2:]).lower()
-            if compound_suffix in {'.sql.gz', '.tar.gz'}:
-                return True
-        
-        name_lower = file_path.name.lower()
-        backup_patterns = ['backup', 'dump', 'export']
-        
-        return any(pattern in name_lower for pattern in backup_patterns)
-    
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format.
-        
-        Args:
-            size_bytes: Size in bytes
-            
-        Returns:
-            Formatted size string
-        """
-        if size_bytes == 0:
-            return "0 B"
-        
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        unit_index = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-        
-        if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.1f} {units[unit_index]}"
+
+        # Anchored at the start: a bare substring match drags in names
+        # that merely mention a pattern (e.g. not_backup.txt).
+        return name_lower.startswith(self._BACKUP_PATTERNS)
     
     def get_storage_info(self) -> Dict[str, Any]:
         """Get storage information and statistics.
@@ -245,18 +255,18 @@ class LocalStorage:
         space_info = self.get_available_space()
         backups = self.list_backups()
         
-        total_backup_size = sum(backup['size_bytes'] for backup in backups)
+        total_backup_size = sum(backup.size_bytes for backup in backups)
         
         return {
             'type': 'local',
             'path': str(self.base_path),
             'backup_count': len(backups),
-            'total_backup_size': self._format_size(total_backup_size),
+            'total_backup_size': format_size(total_backup_size),
             'total_backup_size_bytes': total_backup_size,
             'disk_space': {
-                'total': self._format_size(space_info['total']),
-                'used': self._format_size(space_info['used']),
-                'free': self._format_size(space_info['free'])
+                'total': format_size(space_info['total']),
+                'used': format_size(space_info['used']),
+                'free': format_size(space_info['free'])
             }
         }
     
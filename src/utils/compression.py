@@ -2,26 +2,134 @@
 Compression utilities for backup files
 """
 
-import gzip
+import mmap
+import os
 import shutil
+import subprocess
 from pathlib import Path
 from typing import Optional
 
+try:
+    # ISA-L's igzip produces standard gzip output through the same API,
+    # several times faster than zlib; its levels only run 0-3.
+    from isal import igzip as gzip
+    _GZIP_MAX_LEVEL = 3
+except ImportError:
+    import gzip
+    _GZIP_MAX_LEVEL = 9
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+_FADVISE_WINDOW = 64 * 1024 * 1024
+
+
+def _advise_sequential(fileobj) -> None:
+    """Hint the kernel that a file will be read sequentially.
+
+    Triggers aggressive readahead for linear scans of large dump files.
+    No-op on platforms without posix_fadvise or on non-file objects.
+
+    Args:
+        fileobj: Readable file object opened on a regular file
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = fileobj.fileno()
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except (OSError, AttributeError):
+        pass
+
+
+def _copy_with_fadvise(f_in, f_out) -> None:
+    """Copy file contents while hinting the kernel about the access pattern.
+
+    Advises sequential readahead up front and drops each consumed 64 MiB
+    window from the page cache, so compressing a multi-GB dump does not
+    evict a concurrent workload's pages. Falls back to a plain copy when
+    posix_fadvise is unavailable.
+
+    Args:
+        f_in: Readable binary file object
+        f_out: Writable binary file object
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        shutil.copyfileobj(f_in, f_out)
+        return
+
+    _advise_sequential(f_in)
+
+    try:
+        fd = f_in.fileno()
+    except (OSError, AttributeError):
+        shutil.copyfileobj(f_in, f_out)
+        return
+
+    window_start = 0
+    copied = 0
+    while True:
+        chunk = f_in.read(1024 * 1024)
+        if not chunk:
+            break
+        f_out.write(chunk)
+        copied += len(chunk)
+        if copied - window_start >= _FADVISE_WINDOW:
+            os.posix_fadvise(fd, window_start, copied - window_start, os.POSIX_FADV_DONTNEED)
+            window_start = copied
+
+    if copied > window_start:
+        os.posix_fadvise(fd, window_start, copied - window_start, os.POSIX_FADV_DONTNEED)
 
-def compress_file(source_file: str, output_file: Optional[str] = None) -> str:
+
+def _feed_mmap(mm, f_out) -> None:
+    """Feed a memory-mapped input to a compressing writer.
+
+    The compressor consumes memoryview slices straight off the mapping,
+    skipping the per-read bytes copy a buffered file would make. Each
+    consumed 64 MiB window is dropped from memory so a multi-GB dump
+    never inflates RSS.
+
+    Args:
+        mm: Read-only mmap over the source file
+        f_out: Writable compressing file object
+    """
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+    window_start = 0
+    with memoryview(mm) as view:
+        for offset in range(0, len(mm), 1024 * 1024):
+            f_out.write(view[offset:offset + 1024 * 1024])
+
+            if hasattr(mmap, 'MADV_DONTNEED') and offset - window_start >= _FADVISE_WINDOW:
+                mm.madvise(mmap.MADV_DONTNEED, window_start, offset - window_start)
+                window_start = offset
+
+
+def compress_file(source_file: str, output_file: Optional[str] = None,
+                  compresslevel: int = 3) -> str:
     """Compress a file using gzip compression.
-    
+
+    Reads and writes in 1 MiB chunks — zlib throughput collapses when fed
+    tiny buffers — and defaults to level 3: level 9 costs roughly 3x the
+    CPU for a few percent extra ratio on typical dump data.
+
     Args:
         source_file: Path to the source file to compress
         output_file: Output path for compressed file (optional)
-        
+        compresslevel: gzip compression level 1-9 (default: 3)
+
     Returns:
         Path to the compressed file
-        
+
     Raises:
         FileNotFoundError: If source file doesn't exist
         OSError: If compression operation fails
@@ -29,18 +137,28 @@ def compress_file(source_file: str, output_file: Optional[str] = None) -> str:
     source_path = Path(source_file)
     if not source_path.exists():
         raise FileNotFoundError(f"Source file not found: {source_file}")
-    
+
     if output_file is None:
         output_file = str(source_path) + '.gz'
-    
+
     output_path = Path(output_file)
-    
+
     try:
         logger.info(f"Compressing file: {source_file} -> {output_file}")
-        
-        with open(source_path, 'rb') as f_in:
-            with gzip.open(output_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+
+        with open(source_path, 'rb', buffering=1 << 20) as f_in:
+            with open(output_path, 'wb', buffering=1 << 20) as raw_out:
+                with gzip.GzipFile(fileobj=raw_out, mode='wb',
+                                   compresslevel=min(compresslevel, _GZIP_MAX_LEVEL)) as f_out:
+                    try:
+                        mm = mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (ValueError, OSError):
+                        # Empty files and exotic filesystems can't be
+                        # mapped; fall back to the buffered copy loop.
+                        _copy_with_fadvise(f_in, f_out)
+                    else:
+                        with mm:
+                            _feed_mmap(mm, f_out)
         
         original_size = source_path.stat().st_size
         compressed_size = output_path.stat().st_size
@@ -61,6 +179,153 @@ def compress_file(source_file: str, output_file: Optional[str] = None) -> str:
         raise OSError(f"Compression operation failed: {e}")
 
 
+def preferred_codec(codec: str) -> str:
+    """Resolve the compression codec that can actually be used.
+
+    Args:
+        codec: Requested codec ('zstd' or 'gzip')
+
+    Returns:
+        The requested codec if its backing library is available,
+        otherwise 'gzip'
+    """
+    if codec == 'zstd' and zstandard is not None:
+        return 'zstd'
+    return 'gzip'
+
+
+def codec_suffix(codec: str) -> str:
+    """Get the file suffix for a compression codec.
+
+    Args:
+        codec: Compression codec name
+
+    Returns:
+        File suffix including the leading dot
+    """
+    return '.zst' if codec == 'zstd' else '.gz'
+
+
+def open_compressor(fileobj, codec: str = 'gzip', level: Optional[int] = None,
+                    threads: Optional[int] = None):
+    """Wrap a writable binary file object in a compressing writer.
+
+    Args:
+        fileobj: Writable binary file object
+        codec: Compression codec ('gzip' or 'zstd')
+        level: Compression level (codec-specific default if None)
+        threads: Number of compression threads for zstd (-1 = all cores)
+
+    Returns:
+        Writable compressing file object (context manager)
+
+    Raises:
+        OSError: If the requested codec is not available
+    """
+    if codec == 'zstd':
+        if zstandard is None:
+            raise OSError("zstandard package is not installed")
+        cctx = zstandard.ZstdCompressor(
+            level=level if level is not None else 3,
+            threads=threads if threads is not None else -1
+        )
+        return cctx.stream_writer(fileobj)
+
+    return gzip.GzipFile(fileobj=fileobj, mode='wb',
+                         compresslevel=min(level if level is not None else 3,
+                                           _GZIP_MAX_LEVEL))
+
+
+def compress_file_parallel(source_file: str, output_file: Optional[str] = None,
+                           codec: str = 'zstd', level: int = 3,
+                           threads: Optional[int] = None) -> str:
+    """Compress a file using a multi-threaded compressor.
+
+    Uses the zstandard library when available, falling back to pigz and
+    finally to single-threaded gzip so compression always succeeds.
+
+    Args:
+        source_file: Path to the source file to compress
+        output_file: Output path for compressed file (optional)
+        codec: Preferred codec ('zstd' or 'gzip')
+        level: Compression level
+        threads: Number of compression threads (default: all cores)
+
+    Returns:
+        Path to the compressed file
+
+    Raises:
+        FileNotFoundError: If source file doesn't exist
+        OSError: If compression operation fails
+    """
+    source_path = Path(source_file)
+    if not source_path.exists():
+        raise FileNotFoundError(f"Source file not found: {source_file}")
+
+    if threads is None:
+        threads = os.cpu_count() or 1
+
+    if codec == 'zstd' and zstandard is not None:
+        if output_file is None:
+            output_file = str(source_path) + '.zst'
+        output_path = Path(output_file)
+
+        try:
+            logger.info(f"Compressing file with zstd ({threads} threads): "
+                        f"{source_file} -> {output_file}")
+
+            cctx = zstandard.ZstdCompressor(level=level, threads=threads)
+            with open(source_path, 'rb') as f_in:
+                _advise_sequential(f_in)
+                with open(output_path, 'wb') as f_out:
+                    cctx.copy_stream(f_in, f_out, read_size=1 << 20, write_size=1 << 20)
+
+            return str(output_path)
+
+        except Exception as e:
+            logger.error(f"zstd compression failed: {e}")
+            if output_path.exists():
+                try:
+                    output_path.unlink()
+                except Exception:
+                    pass
+            raise OSError(f"Compression operation failed: {e}")
+
+    pigz_cmd = shutil.which('pigz')
+    if pigz_cmd:
+        if output_file is None:
+            output_file = str(source_path) + '.gz'
+        output_path = Path(output_file)
+
+        try:
+            logger.info(f"Compressing file with pigz ({threads} threads): "
+                        f"{source_file} -> {output_file}")
+
+            with open(source_path, 'rb') as f_in:
+                _advise_sequential(f_in)
+                with open(output_path, 'wb') as f_out:
+                    subprocess.run(
+                        [pigz_cmd, '-p', str(threads), '-c'],
+                        stdin=f_in,
+                        stdout=f_out,
+                        check=True
+                    )
+
+            return str(output_path)
+
+        except Exception as e:
+            logger.error(f"pigz compression failed: {e}")
+            if output_path.exists():
+                try:
+                    output_path.unlink()
+                except Exception:
+                    pass
+            raise OSError(f"Compression operation failed: {e}")
+
+    logger.debug("No parallel compressor available, falling back to gzip")
+    return compress_file(source_file, output_file)
+
+
 def decompress_file(source_file: str, output_file: str) -> str:
     """Decompress a gzip-compressed file.
     
@@ -84,10 +349,21 @@ def decompress_file(source_file: str, output_file: str) -> str:
     
     try:
         logger.info(f"Decompressing file: {source_file} -> {output_file}")
-        
-        with gzip.open(source_path, 'rb') as f_in:
-            with open(output_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+
+        if _is_zstd_file(source_file):
+            if zstandard is None:
+                raise OSError("Backup is zstd-compressed but the zstandard package is not installed")
+            dctx = zstandard.ZstdDecompressor()
+            with open(source_path, 'rb') as f_in:
+                with open(output_path, 'wb') as f_out:
+                    dctx.copy_stream(f_in, f_out)
+        else:
+            # 1 MiB copy chunks, matching the compression side — the
+            # default 64 KiB buffer costs ~16x the Python-level
+            # read/write round-trips on multi-GB dumps.
+            with gzip.open(source_path, 'rb') as f_in:
+                with open(output_path, 'wb', buffering=1 << 20) as f_out:
+                    shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
         
         compressed_size = source_path.stat().st_size
         decompressed_size = output_path.stat().st_size
@@ -106,19 +382,88 @@ def decompress_file(source_file: str, output_file: str) -> str:
         raise OSError(f"Decompression operation failed: {e}")
 
 
+def open_decompressor(source_file: str):
+    """Open a compressed file as a readable decompressed stream.
+
+    Counterpart of open_compressor for the restore path: the caller
+    reads plain dump bytes while decompression happens inline, so no
+    decompressed copy lands on disk.
+
+    Args:
+        source_file: Path to the compressed source file
+
+    Returns:
+        Readable binary file object yielding decompressed bytes
+
+    Raises:
+        OSError: If the file is zstd-compressed and the zstandard
+            package is not installed
+    """
+    if _is_zstd_file(source_file):
+        if zstandard is None:
+            raise OSError("Backup is zstd-compressed but the zstandard package is not installed")
+        dctx = zstandard.ZstdDecompressor()
+        return dctx.stream_reader(open(source_file, 'rb'))
+    return gzip.open(source_file, 'rb')
+
+
+def open_decompressor_stream(fileobj, name: str):
+    """Wrap a readable stream with the decompressor its name implies.
+
+    For non-seekable sources (e.g. an S3 object body) the magic bytes
+    cannot be probed and rewound, so the codec is picked from the
+    backup name instead. Unrecognized names pass through untouched.
+
+    Args:
+        fileobj: Readable binary file object with compressed bytes
+        name: File name whose suffix selects the codec
+
+    Returns:
+        Readable binary file object yielding decompressed bytes
+
+    Raises:
+        OSError: If the name implies zstd and the zstandard package is
+            not installed
+    """
+    suffix = Path(name).suffix.lower()
+    if suffix == '.zst':
+        if zstandard is None:
+            raise OSError("Backup is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().stream_reader(fileobj)
+    if suffix in ('.gz', '.tgz'):
+        return gzip.GzipFile(fileobj=fileobj, mode='rb')
+    return fileobj
+
+
+def _is_zstd_file(file_path: str) -> bool:
+    """Check if a file is zstd compressed.
+
+    Args:
+        file_path: Path to the file to check
+
+    Returns:
+        True if file is zstd compressed, False otherwise
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(4) == b'\x28\xb5\x2f\xfd'
+    except Exception:
+        return False
+
+
 def is_compressed(file_path: str) -> bool:
-    """Check if a file is gzip compressed.
-    
+    """Check if a file is gzip or zstd compressed.
+
     Args:
         file_path: Path to the file to check
-        
+
     Returns:
-        True if file is gzip compressed, False otherwise
+        True if file is compressed, False otherwise
     """
     try:
         with open(file_path, 'rb') as f:
-            magic = f.read(2)
-            return magic == b'\x1f\x8b'
+            magic = f.read(4)
+            return magic[:2] == b'\x1f\x8b' or magic == b'\x28\xb5\x2f\xfd'
     except Exception:
         return False
 
@@ -168,32 +513,51 @@ def estimate_compressed_size(file_path: str, compression_ratio: float = 0.2) ->
 
 def compress_multiple_files(file_paths: list, output_dir: str) -> list:
     """Compress multiple files to a directory.
-    
+
+    Each file is an independent CPU-bound gzip job, so the batch fans
+    out across a process pool — threads would serialize on the GIL for
+    much of zlib's state handling. Files that fail to compress are
+    logged and skipped, as before.
+
     Args:
         file_paths: List of file paths to compress
         output_dir: Directory where to save compressed files
-        
+
     Returns:
-        List of compressed file paths
+        List of compressed file paths, in input order
     """
     output_directory = Path(output_dir)
     output_directory.mkdir(parents=True, exist_ok=True)
-    
-    compressed_files = []
-    
+
+    jobs = []
     for file_path in file_paths:
+        source_path = Path(file_path)
+        if not source_path.exists():
+            logger.warning(f"Skipping non-existent file: {file_path}")
+            continue
+        jobs.append((str(source_path), str(output_directory / (source_path.name + '.gz'))))
+
+    if not jobs:
+        return []
+
+    if len(jobs) == 1:
+        source, output = jobs[0]
         try:
-            source_path = Path(file_path)
-            if not source_path.exists():
-                logger.warning(f"Skipping non-existent file: {file_path}")
-                continue
-            
-            output_file = output_directory / (source_path.name + '.gz')
-            
-            compressed_file = compress_file(str(source_path), str(output_file))
-            compressed_files.append(compressed_file)
-            
+            return [compress_file(source, output)]
         except Exception as e:
-            logger.error(f"Failed to compress {file_path}: {e}")
-    
+            logger.error(f"Failed to compress {source}: {e}")
+            return []
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    compressed_files = []
+    max_workers = min(os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(compress_file, source, output) for source, output in jobs]
+        for (source, _), future in zip(jobs, futures):
+            try:
+                compressed_files.append(future.result())
+            except Exception as e:
+                logger.error(f"Failed to compress {source}: {e}")
+
     return compressed_files
@@ -0,0 +1,48 @@
+"""
+Streaming hash utilities for backup integrity
+"""
+
+import hashlib
+
+
+class HashingWriter:
+    """File-object wrapper that hashes bytes as they are written.
+
+    Lets the backup pipeline compute a checksum in-flight instead of
+    re-reading the finished file afterwards.
+    """
+
+    def __init__(self, fileobj, algorithm: str = 'sha256'):
+        """Initialize the hashing writer.
+
+        Args:
+            fileobj: Underlying writable binary file object
+            algorithm: Hash algorithm name accepted by hashlib
+        """
+        self._fileobj = fileobj
+        self._hasher = hashlib.new(algorithm)
+        self.algorithm = algorithm
+
+    def write(self, data) -> int:
+        """Write data to the underlying file and update the hash.
+
+        Args:
+            data: Bytes to write
+
+        Returns:
+            Number of bytes written
+        """
+        self._hasher.update(data)
+        return self._fileobj.write(data)
+
+    def flush(self) -> None:
+        """Flush the underlying file object."""
+        self._fileobj.flush()
+
+    def hexdigest(self) -> str:
+        """Get the hex digest of everything written so far.
+
+        Returns:
+            Hexadecimal digest string
+        """
+        return self._hasher.hexdigest()
@@ -2,12 +2,179 @@
 Logging utilities for dbVault
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+#: Background listener that owns the file handlers; module-level so a
+#: repeated setup_logging call can stop the previous one.
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+_periodic_flusher: Optional['_PeriodicFlusher'] = None
+
+#: The default daily log handler is shared across setup_logging calls:
+#: recreating it per call costs a mkdir+stat+open triple. Rotation is
+#: the handler's own job, so a long-running process rolls at midnight
+#: instead of writing tomorrow's logs into today's file.
+_default_file_handler: Optional[logging.FileHandler] = None
+
+
+def _get_default_file_handler() -> logging.FileHandler:
+    """Get the shared handler for the default daily log file."""
+    global _default_file_handler
+
+    if _default_file_handler is None:
+        default_log_dir = Path.home() / '.dbvault' / 'logs'
+        default_log_dir.mkdir(parents=True, exist_ok=True)
+
+        # delay=True defers the open(2) until the first record lands,
+        # so a run that never logs costs no file descriptor.
+        handler = BufferedTimedRotatingFileHandler(
+            default_log_dir / 'dbvault.log', when='midnight',
+            backupCount=30, encoding='utf-8', delay=True
+        )
+        handler.setLevel(logging.INFO)
+        _default_file_handler = handler
+
+    return _default_file_handler
+
+
+#: Dedicated JSON-lines sink for the 'dbvault.metrics' logger, shared
+#: across setup_logging calls like the default handler above.
+_metrics_handler: Optional[logging.FileHandler] = None
+
+
+def _get_metrics_handler() -> logging.FileHandler:
+    """Get the shared JSON-lines handler for backup metrics."""
+    global _metrics_handler
+
+    if _metrics_handler is None:
+        default_log_dir = Path.home() / '.dbvault' / 'logs'
+        default_log_dir.mkdir(parents=True, exist_ok=True)
+
+        handler = BufferedFileHandler(default_log_dir / 'metrics.log', delay=True)
+        handler.setFormatter(JsonMetricsFormatter())
+        _metrics_handler = handler
+
+    return _metrics_handler
+
+
+def _stop_queue_listener() -> None:
+    """Stop the background log listener and flusher, if running."""
+    global _queue_listener, _periodic_flusher
+    if _periodic_flusher is not None:
+        _periodic_flusher.stop()
+        _periodic_flusher = None
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches routine records in a 64 KiB buffer.
+
+    The base StreamHandler flushes after every record — one write(2)
+    per log line. Here INFO/DEBUG records ride the buffer and only
+    ERROR and above flush immediately; a periodic flusher bounds how
+    long buffered records can linger, and logging.shutdown flushes the
+    rest at exit.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=65536,
+                    encoding=self.encoding)
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """TimedRotatingFileHandler with BufferedFileHandler's write batching."""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=65536,
+                    encoding=self.encoding)
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _PeriodicFlusher:
+    """Flush a set of handlers on a fixed interval via a daemon timer."""
+
+    def __init__(self, handlers, interval: float = 2.0):
+        self._handlers = handlers
+        self._interval = interval
+        self._timer: Optional[threading.Timer] = None
+        self._schedule()
+
+    def _schedule(self) -> None:
+        self._timer = threading.Timer(self._interval, self._run)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _run(self) -> None:
+        for handler in self._handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+        self._schedule()
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+class JsonMetricsFormatter(logging.Formatter):
+    """Serialize metric records as compact JSON lines.
+
+    Records carry their payload in a ``metrics`` attribute (passed via
+    ``extra=``) instead of repr-ing a dict into the message, so the
+    file is machine-parseable and json.dumps runs once per record.
+    """
+
+    def format(self, record):
+        payload = {'ts': self.formatTime(record), 'msg': record.getMessage()}
+        payload.update(getattr(record, 'metrics', {}))
+        return json.dumps(payload, separators=(',', ':'), default=str)
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for different log levels."""
@@ -20,13 +187,23 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[35m',
         'RESET': '\033[0m'
     }
-    
+
+    #: Fully wrapped level names, built once — format() does a single
+    #: levelno lookup instead of two dict gets and an f-string per record.
+    _COLORED_LEVELS = {
+        getattr(logging, level): f"{color}{level}\033[0m"
+        for level, color in COLORS.items() if level != 'RESET'
+    }
+
     def format(self, record):
-        if hasattr(record, 'levelname'):
-            color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-            record.levelname = f"{color}{record.levelname}{self.COLORS['RESET']}"
-        
-        return super().format(record)
+        original_levelname = record.levelname
+        record.levelname = self._COLORED_LEVELS.get(record.levelno, original_levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Records are shared across handlers; the file handlers
+            # must not see the ANSI-wrapped level name.
+            record.levelname = original_levelname
 
 
 def setup_logging(verbose: bool = False, log_file: Optional[str] = None) -> None:
@@ -36,48 +213,79 @@ def setup_logging(verbose: bool = False, log_file: Optional[str] = None) -> None
         verbose: Enable debug logging
         log_file: Optional file to write logs to
     """
+    global _queue_listener
+
     log_level = logging.DEBUG if verbose else logging.INFO
-    
+
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    
-    colored_formatter = ColoredFormatter(
-        '%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
-    )
-    
+
+    # Color only a real terminal; in CI/cron/docker the escapes would
+    # land as literal bytes in captured output. NO_COLOR is the usual
+    # opt-out convention (https://no-color.org).
+    if sys.stdout.isatty() and os.environ.get('NO_COLOR') is None:
+        console_formatter = ColoredFormatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%H:%M:%S'
+        )
+    else:
+        console_formatter = logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%H:%M:%S'
+        )
+
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    
+
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
-    
+
+    _stop_queue_listener()
+
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(colored_formatter)
+    console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
-    
+
+    file_handlers = []
+
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_path)
+
+        file_handler = BufferedFileHandler(log_path)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-    
-    default_log_dir = Path.home() / '.dbvault' / 'logs'
-    default_log_dir.mkdir(parents=True, exist_ok=True)
-    
-    log_filename = f"dbvault_{datetime.now().strftime('%Y%m%d')}.log"
-    default_log_file = default_log_dir / log_filename
-    
-    file_handler = logging.FileHandler(default_log_file)
-    file_handler.setLevel(logging.INFO)
+        file_handlers.append(file_handler)
+
+    file_handler = _get_default_file_handler()
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    file_handlers.append(file_handler)
+
+    # File handlers live behind a queue: callers pay one lock-free put
+    # per record instead of a write(2) under the GIL, and the listener
+    # thread does the actual file I/O. The console handler stays direct
+    # — stdout is line-buffered and cheap.
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *file_handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    # Metrics bypass the root logger: a dedicated JSON-lines handler
+    # keeps them parseable instead of repr'd into the main log.
+    metrics_handler = _get_metrics_handler()
+    metrics_logger = logging.getLogger('dbvault.metrics')
+    metrics_logger.propagate = False
+    if metrics_handler not in metrics_logger.handlers:
+        metrics_logger.addHandler(metrics_handler)
+
+    global _periodic_flusher
+    _periodic_flusher = _PeriodicFlusher(file_handlers + [metrics_handler])
+
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -98,7 +306,10 @@ class BackupLogger:
     def __init__(self, logger_name: str):
         self.logger = get_logger(logger_name)
         self.start_time = None
+        self._start_monotonic = None
         self.operation = None
+        self._operation_title = 'None'
+        self._prefix = '[None] '
     
     def start_operation(self, operation: str, details: str = "") -> None:
         """Log the start of a backup operation.
@@ -108,39 +319,67 @@ class BackupLogger:
             details: Additional details about the operation
         """
         self.operation = operation
+        # Title-casing and the bracket prefix are per-operation
+        # constants; computing them here keeps them out of every
+        # log_progress/log_success call.
+        self._operation_title = operation.title()
+        self._prefix = f"[{operation}] "
         self.start_time = datetime.now()
-        
-        message = f"Starting {operation}"
+        # Durations come from the monotonic clock: immune to NTP jumps
+        # and a plain float subtraction instead of a timedelta.
+        self._start_monotonic = time.monotonic()
+
         if details:
-            message += f": {details}"
-            
-        self.logger.info(message)
+            self.logger.info("Starting %s: %s", operation, details)
+        else:
+            self.logger.info("Starting %s", operation)
     
-    def log_progress(self, message: str) -> None:
+    def log_progress(self, message: str, *args) -> None:
         """Log progress during an operation.
-        
+
+        Args:
+            message: Progress message, optionally with %-style placeholders
+            *args: Lazy arguments for the placeholders, only formatted
+                when INFO logging is enabled
+        """
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._prefix + message, *args)
+
+    def log_progress_bytes(self, message: str, size_bytes: int) -> None:
+        """Log progress including a byte count shown in MiB.
+
+        Formatting is deferred behind an isEnabledFor gate and the
+        bytes-to-MiB conversion uses a shift instead of float division.
+
         Args:
             message: Progress message
+            size_bytes: Size in bytes, rendered as whole MiB
         """
-        self.logger.info(f"[{self.operation}] {message}")
-    
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._prefix + "%s (%d MiB)", message, size_bytes >> 20)
+
+
     def log_success(self, result: str = "") -> None:
         """Log successful completion of an operation.
         
         Args:
             result: Result details
         """
-        if self.start_time:
-            duration = datetime.now() - self.start_time
-            duration_str = f" (took {duration.total_seconds():.2f}s)"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        if self._start_monotonic is not None:
+            duration = time.monotonic() - self._start_monotonic
+            duration_str = f" (took {duration:.2f}s)"
         else:
             duration_str = ""
-            
-        message = f"{self.operation.title()} completed successfully{duration_str}"
+
         if result:
-            message += f": {result}"
-            
-        self.logger.info(message)
+            self.logger.info("%s completed successfully%s: %s",
+                             self._operation_title, duration_str, result)
+        else:
+            self.logger.info("%s completed successfully%s",
+                             self._operation_title, duration_str)
     
     def log_error(self, error: str, exception: Optional[Exception] = None) -> None:
         """Log an error during an operation.
@@ -149,18 +388,14 @@ class BackupLogger:
             error: Error message
             exception: Optional exception for stack trace
         """
-        if self.start_time:
-            duration = datetime.now() - self.start_time
-            duration_str = f" (failed after {duration.total_seconds():.2f}s)"
+        if self._start_monotonic is not None:
+            duration = time.monotonic() - self._start_monotonic
+            duration_str = f" (failed after {duration:.2f}s)"
         else:
             duration_str = ""
-            
-        message = f"{self.operation.title()} failed{duration_str}: {error}"
-        
-        if exception:
-            self.logger.error(message, exc_info=True)
-        else:
-            self.logger.error(message)
+
+        self.logger.error("%s failed%s: %s", self._operation_title,
+                          duration_str, error, exc_info=bool(exception))
     
     def log_warning(self, warning: str) -> None:
         """Log a warning during an operation.
@@ -168,7 +403,7 @@ class BackupLogger:
         Args:
             warning: Warning message
         """
-        self.logger.warning(f"[{self.operation}] {warning}")
+        self.logger.warning("%s%s", self._prefix, warning)
 
 
 def log_backup_metrics(operation: str, database_type: str, database_name: str, 
@@ -185,13 +420,20 @@ def log_backup_metrics(operation: str, database_type: str, database_name: str,
         storage_type: Storage backend used
     """
     logger = get_logger('dbvault.metrics')
-    
+
+    # Building the dict is the expensive part; skip it entirely when
+    # metrics logging is filtered out.
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    # No explicit timestamp: the formatter's %(asctime)s already stamps
+    # the record from LogRecord.created, so datetime.now().isoformat()
+    # here would be paid twice per metric.
     metrics = {
         'operation': operation,
         'database_type': database_type,
         'database_name': database_name,
         'storage_type': storage_type,
-        'timestamp': datetime.now().isoformat(),
     }
     
     if backup_size is not None:
@@ -200,8 +442,8 @@ def log_backup_metrics(operation: str, database_type: str, database_name: str,
     
     if duration is not None:
         metrics['duration_seconds'] = round(duration, 2)
-    
-    logger.info(f"METRICS: {metrics}")
+
+    logger.info("METRICS", extra={'metrics': metrics})
 
 
 def log_database_connection(database_type: str, host: str, database: str, success: bool) -> None:
@@ -215,7 +457,7 @@ def log_database_connection(database_type: str, host: str, database: str, succes
     """
     logger = get_logger('dbvault.connection')
     status = "successful" if success else "failed"
-    logger.info(f"Database connection {status}: {database_type}://{host}/{database}")
+    logger.info("Database connection %s: %s://%s/%s", status, database_type, host, database)
 
 
 def log_storage_operation(operation: str, storage_type: str, path: str, success: bool) -> None:
@@ -229,4 +471,4 @@ def log_storage_operation(operation: str, storage_type: str, path: str, success:
     """
     logger = get_logger('dbvault.storage')
     status = "successful" if success else "failed"
-    logger.info(f"Storage {operation} {status}: {storage_type}://{path}")
+    logger.info("Storage %s %s: %s://%s", operation, status, storage_type, path)
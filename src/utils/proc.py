@@ -0,0 +1,72 @@
+"""
+Subprocess helpers for external database tools
+"""
+
+import os
+import subprocess
+import tempfile
+from typing import Optional, Tuple
+
+
+def preallocate(fileobj, size: int) -> bool:
+    """Best-effort preallocation of an output file's extents.
+
+    Growing an archive through many small appends fragments it on
+    ext4/xfs; posix_fallocate hands the filesystem one contiguous
+    request up front. Callers that allocate more than they write must
+    truncate back to the real length afterwards.
+
+    Args:
+        fileobj: Writable file object backed by a real file
+        size: Expected size in bytes
+
+    Returns:
+        True if the extent was preallocated
+    """
+    if size <= 0 or not hasattr(os, 'posix_fallocate'):
+        return False
+    try:
+        os.posix_fallocate(fileobj.fileno(), 0, size)
+        return True
+    except OSError:
+        return False
+
+
+def run_tool(cmd: list, env: Optional[dict] = None, timeout: int = 3600,
+             stdout=subprocess.DEVNULL, stdin=None) -> Tuple[int, str]:
+    """Run an external tool with file-backed stderr.
+
+    capture_output=True buffers stdout and stderr through pipes the
+    Python side must drain; a chatty tool (pg_dump --verbose) can block
+    on write() or balloon memory. Spooling stderr into an unnamed temp
+    file lets the kernel absorb it and the text is read back only after
+    the process exits.
+
+    Args:
+        cmd: Command and arguments to execute
+        env: Environment for the subprocess (inherited if None)
+        timeout: Seconds to wait before aborting
+        stdout: Target for the tool's stdout (default: discarded, since
+            dump tools write their payload via --file/--archive)
+        stdin: Source for the tool's stdin (default: inherited)
+
+    Returns:
+        Tuple of (return code, decoded stderr text)
+
+    Raises:
+        subprocess.TimeoutExpired: If the tool exceeds the timeout
+        FileNotFoundError: If the tool binary does not exist
+    """
+    with tempfile.TemporaryFile() as err:
+        completed = subprocess.run(
+            cmd,
+            env=env,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=err,
+            timeout=timeout
+        )
+        err.seek(0)
+        stderr_text = err.read().decode(errors='replace')
+
+    return completed.returncode, stderr_text
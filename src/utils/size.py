@@ -0,0 +1,27 @@
+"""
+Size formatting helper shared by storage and restore modules
+"""
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def format_size(size_bytes: int) -> str:
+    """Format a byte count in human-readable form.
+
+    Each unit step is 2^10, so the unit index falls straight out of the
+    bit length — no divide loop per call.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Formatted size string, e.g. '1.5 MB'
+    """
+    if size_bytes <= 0:
+        return "0 B"
+
+    unit_index = min((size_bytes.bit_length() - 1) // 10, len(_UNITS) - 1)
+
+    if unit_index == 0:
+        return f"{size_bytes} B"
+    return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_UNITS[unit_index]}"
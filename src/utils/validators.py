@@ -2,10 +2,34 @@
 Input validation utilities
 """
 
+import os
 import re
+import string
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
+# Patterns compiled once at import: per-call re.match/re.sub would hash
+# the literal and hit the module cache lock on every validation.
+_IP_RE = re.compile(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$')
+
+# One table does both sanitize passes in a single scan: problematic
+# filesystem characters map to '_', control characters are deleted.
+_SANITIZE_TABLE = {ord(c): ord('_') for c in '<>:"/\\|?*'}
+_SANITIZE_TABLE.update(dict.fromkeys(list(range(0x20)) + [0x7f]))
+
+# The allowlist checks skip the regex engine entirely: each table
+# deletes the allowed characters, so a name is valid exactly when
+# translate() leaves nothing behind — one C-level pass per string.
+_REQUIRED_DB_FIELDS = frozenset({'type', 'host', 'username', 'database'})
+_REQUIRED_AWS_FIELDS = frozenset({'bucket', 'region'})
+_VALID_DB_TYPES = frozenset({'postgresql', 'postgres', 'mongodb', 'mongo'})
+
+_DB_NAME_STRIP = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
+_HOSTNAME_STRIP = str.maketrans('', '', string.ascii_letters + string.digits + '.-')
+_S3_BUCKET_STRIP = str.maketrans('', '', string.ascii_lowercase + string.digits + '.-')
+_BACKUP_NAME_STRIP = str.maketrans('', '', string.ascii_letters + string.digits + '._-')
+
 
 def validate_database_name(name: str) -> bool:
     """Validate database name format.
@@ -18,9 +42,14 @@ def validate_database_name(name: str) -> bool:
     """
     if not name or not isinstance(name, str):
         return False
-    
-    pattern = r'^[a-zA-Z0-9_-]+$'
-    return bool(re.match(pattern, name)) and len(name) <= 63
+
+    return _validate_database_name(name)
+
+
+@lru_cache(maxsize=256)
+def _validate_database_name(name: str) -> bool:
+    """Cached character and length check for validate_database_name."""
+    return not name.translate(_DB_NAME_STRIP) and len(name) <= 63
 
 
 def validate_hostname(hostname: str) -> bool:
@@ -34,18 +63,20 @@ def validate_hostname(hostname: str) -> bool:
     """
     if not hostname or not isinstance(hostname, str):
         return False
-    
+
+    return _validate_hostname(hostname)
+
+
+@lru_cache(maxsize=256)
+def _validate_hostname(hostname: str) -> bool:
+    """Cached format check for validate_hostname."""
     if hostname == 'localhost':
         return True
-    
-    hostname_pattern = r'^[a-zA-Z0-9.-]+$'
-    if not re.match(hostname_pattern, hostname):
-        return False
-    
-    if len(hostname) > 253:
+
+    if hostname.translate(_HOSTNAME_STRIP):
         return False
-    
-    return True
+
+    return len(hostname) <= 253
 
 
 def validate_port(port: Union[int, str]) -> bool:
@@ -74,16 +105,16 @@ def validate_file_path(path: str, must_exist: bool = False) -> bool:
     Returns:
         True if path is valid, False otherwise
     """
-    if not path or not isinstance(path, str):
+    if not path or not isinstance(path, str) or '\x00' in path:
         return False
-    
+
+    # Building a Path (and the pwd lookup behind expanduser) is only
+    # needed when we actually have to stat the file.
+    if not must_exist:
+        return True
+
     try:
-        path_obj = Path(path).expanduser()
-        
-        if must_exist:
-            return path_obj.exists()
-        else:
-            return True
+        return Path(path).expanduser().exists()
     except (OSError, ValueError):
         return False
 
@@ -99,22 +130,26 @@ def validate_s3_bucket_name(bucket_name: str) -> bool:
     """
     if not bucket_name or not isinstance(bucket_name, str):
         return False
-    
+
+    return _validate_s3_bucket_name(bucket_name)
+
+
+@lru_cache(maxsize=256)
+def _validate_s3_bucket_name(bucket_name: str) -> bool:
+    """Cached format checks for validate_s3_bucket_name."""
     if len(bucket_name) < 3 or len(bucket_name) > 63:
         return False
     
     if not (bucket_name[0].isalnum() and bucket_name[-1].isalnum()):
         return False
     
-    pattern = r'^[a-z0-9.-]+$'
-    if not re.match(pattern, bucket_name):
+    if bucket_name.translate(_S3_BUCKET_STRIP):
         return False
     
     if '..' in bucket_name or '--' in bucket_name:
         return False
     
-    ip_pattern = r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$'
-    if re.match(ip_pattern, bucket_name):
+    if _IP_RE.match(bucket_name):
         return False
     
     return True
@@ -131,12 +166,8 @@ def validate_backup_name(name: str) -> bool:
     """
     if not name or not isinstance(name, str):
         return False
-    
-    if len(name) > 255:
-        return False
-    
-    pattern = r'^[a-zA-Z0-9._-]+$'
-    return bool(re.match(pattern, name))
+
+    return len(name) <= 255 and not name.translate(_BACKUP_NAME_STRIP)
 
 
 def validate_database_config(config: dict) -> list:
@@ -150,15 +181,11 @@ def validate_database_config(config: dict) -> list:
     """
     errors = []
     
-    required_fields = ['type', 'host', 'username', 'database']
-    for field in required_fields:
-        if field not in config:
-            errors.append(f"Missing required field: {field}")
-    
-    if 'type' in config:
-        valid_types = ['postgresql', 'postgres', 'mongodb', 'mongo']
-        if config['type'] not in valid_types:
-            errors.append(f"Invalid database type: {config['type']}")
+    errors.extend(f"Missing required field: {field}"
+                  for field in sorted(_REQUIRED_DB_FIELDS - config.keys()))
+
+    if 'type' in config and config['type'] not in _VALID_DB_TYPES:
+        errors.append(f"Invalid database type: {config['type']}")
     
     if 'host' in config and not validate_hostname(config['host']):
         errors.append(f"Invalid hostname: {config['host']}")
@@ -198,10 +225,8 @@ def validate_storage_config(config: dict) -> list:
     
     if 'aws' in config:
         aws_config = config['aws']
-        required_aws_fields = ['bucket', 'region']
-        for field in required_aws_fields:
-            if field not in aws_config:
-                errors.append(f"AWS storage missing required field: {field}")
+        errors.extend(f"AWS storage missing required field: {field}"
+                      for field in sorted(_REQUIRED_AWS_FIELDS - aws_config.keys()))
         
         if 'bucket' in aws_config and not validate_s3_bucket_name(aws_config['bucket']):
             errors.append(f"Invalid S3 bucket name: {aws_config['bucket']}")
@@ -221,9 +246,7 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return "unnamed_backup"
     
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
-    sanitized = re.sub(r'[\x00-\x1f\x7f]', '', sanitized)
+    sanitized = filename.translate(_SANITIZE_TABLE)
     
     if len(sanitized) > 200:
         sanitized = sanitized[:200]
@@ -243,11 +266,4 @@ def validate_environment_variables(required_vars: list) -> list:
     Returns:
         List of missing environment variables
     """
-    import os
-    missing_vars = []
-    
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-    
-    return missing_vars
+    return [var for var in required_vars if not os.getenv(var)]
@@ -2,22 +2,73 @@
 Test configuration and fixtures
 """
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 import yaml
 
+@pytest.fixture(autouse=True)
+def isolate_cache_dir(tmp_path, monkeypatch):
+    """Point the user cache dir at tmp_path.
+
+    The config manager writes pickle parse caches under
+    $XDG_CACHE_HOME/dbvault; without this the suite litters the real
+    ~/.cache with sidecars for throwaway config files.
+    """
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+
+@pytest.fixture(autouse=True)
+def reset_handler_caches():
+    """Keep cached boto3 clients and interned handlers from leaking.
+
+    The factories intern handlers per config in class-level _instances
+    dicts; without clearing them a test's mock-backed handler would be
+    reused by any later test that builds an equal config.
+    """
+    from src.database.factory import DatabaseFactory
+    from src.storage import aws_s3
+    from src.storage.factory import StorageFactory
+
+    aws_s3._cached_s3_client.cache_clear()
+    DatabaseFactory._instances.clear()
+    StorageFactory._instances.clear()
+    yield
+    aws_s3._cached_s3_client.cache_clear()
+    DatabaseFactory._instances.clear()
+    StorageFactory._instances.clear()
+
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
+def mocked_factories(monkeypatch):
+    """Patch the factory entry points once and hand out the mocks.
+
+    Stacked @patch decorators re-import the target and walk the
+    attribute chain for every test; this fixture does each setattr
+    once and lets tests configure return values on the shared mocks.
+    """
+    mocks = SimpleNamespace(db=Mock(), storage=Mock(), backup=Mock(), restore=Mock())
+    monkeypatch.setattr('src.database.factory.DatabaseFactory.create_handler', mocks.db)
+    monkeypatch.setattr('src.storage.factory.StorageFactory.create_handler', mocks.storage)
+    monkeypatch.setattr('src.backup.backup_manager.BackupManager', mocks.backup)
+    monkeypatch.setattr('src.restore.restore_manager.RestoreManager', mocks.restore)
+    return mocks
 
 @pytest.fixture
+def temp_dir(tmp_path):
+    """Create a temporary directory for testing.
+
+    Backed by pytest's tmp_path machinery: cleanup happens in bulk at
+    the end of the session (keeping recent runs for debugging) instead
+    of an rmtree in every test's teardown.
+    """
+    return tmp_path
+
+@pytest.fixture(scope='session')
 def sample_config():
-    """Sample configuration for testing."""
+    """Sample configuration for testing.
+
+    Session-scoped: tests treat it as read-only, so one dict serves
+    the whole run. A test that needs to mutate it should deepcopy.
+    """
     return {
         'database': {
             'type': 'postgresql',
@@ -44,15 +95,19 @@ def sample_config():
         }
     }
 
-@pytest.fixture
-def config_file(temp_dir, sample_config):
-    """Create a temporary config file."""
-    config_path = temp_dir / 'test_config.yaml'
+@pytest.fixture(scope='module')
+def config_file(tmp_path_factory, sample_config):
+    """Create a temporary config file.
+
+    Module-scoped so yaml.dump runs once per module instead of once
+    per test; the file is only ever read by the code under test.
+    """
+    config_path = tmp_path_factory.mktemp('dbvault-config') / 'test_config.yaml'
     with open(config_path, 'w') as f:
         yaml.dump(sample_config, f)
     return str(config_path)
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def mongo_config():
     """MongoDB configuration for testing."""
     return {
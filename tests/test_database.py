@@ -91,8 +91,9 @@ class TestDatabaseHandlers:
     def test_postgresql_connection_test_success(self, mock_connect):
         """Test PostgreSQL connection test success."""
         mock_conn = Mock()
+        mock_conn.closed = 0
         mock_connect.return_value = mock_conn
-        
+
         config = {
             'type': 'postgresql',
             'host': 'localhost',
@@ -101,12 +102,18 @@ class TestDatabaseHandlers:
             'password': 'testpass',
             'database': 'testdb'
         }
-        
+
         handler = PostgreSQLHandler(config)
         result = handler.test_connection()
-        
+
         assert result is True
         mock_connect.assert_called_once()
+
+        # The connection is cached and reused on subsequent calls
+        assert handler.test_connection() is True
+        mock_connect.assert_called_once()
+
+        handler.close()
         mock_conn.close.assert_called_once()
     
     @patch('psycopg2.connect')
@@ -128,13 +135,13 @@ class TestDatabaseHandlers:
         
         assert result is False
     
-    @patch('pymongo.MongoClient')
+    @patch('src.database.mongodb.MongoClient')
     def test_mongodb_connection_test_success(self, mock_client):
         """Test MongoDB connection test success."""
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
         mock_client_instance.admin.command.return_value = {'ok': 1}
-        
+
         config = {
             'type': 'mongodb',
             'host': 'localhost',
@@ -143,14 +150,21 @@ class TestDatabaseHandlers:
             'password': '',
             'database': 'testdb'
         }
-        
+
         handler = MongoDBHandler(config)
         result = handler.test_connection()
-        
+
         assert result is True
         mock_client.assert_called_once()
-    
-    @patch('pymongo.MongoClient')
+
+        # The client is cached and reused on subsequent calls
+        assert handler.test_connection() is True
+        mock_client.assert_called_once()
+
+        handler.close()
+        mock_client_instance.close.assert_called_once()
+
+    @patch('src.database.mongodb.MongoClient')
     def test_mongodb_connection_test_failure(self, mock_client):
         """Test MongoDB connection test failure."""
         mock_client.side_effect = Exception("Connection failed")